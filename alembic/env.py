@@ -1,6 +1,7 @@
 import os
 from logging.config import fileConfig
-from sqlalchemy import create_engine, pool
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
 from alembic import context
 from dotenv import load_dotenv
 
@@ -32,7 +33,14 @@ def run_migrations_offline():
 
 # Migrations (online mode)
 def run_migrations_online():
-    connectable = create_engine(db_url, poolclass=pool.NullPool)
+    # Single pooled connection reused across all of a migration's statements
+    connectable = create_engine(
+        db_url,
+        poolclass=QueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_pre_ping=True,
+    )
     with connectable.connect() as connection:
         context.configure(connection=connection, target_metadata=target_metadata)
         with context.begin_transaction():
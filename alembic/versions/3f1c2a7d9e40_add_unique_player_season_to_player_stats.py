@@ -0,0 +1,34 @@
+"""add unique (player_id, season) constraint to player_stats
+
+Revision ID: 3f1c2a7d9e40
+Revises: 91d7e3b74719
+Create Date: 2026-10-16 09:12:44.120318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c2a7d9e40'
+down_revision = '91d7e3b74719'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the most recent row for any duplicated (player_id, season) pair
+    op.execute(
+        """
+        DELETE FROM player_stats a
+        USING player_stats b
+        WHERE a.player_id = b.player_id
+          AND a.season = b.season
+          AND a.stats_id < b.stats_id
+        """
+    )
+    op.create_unique_constraint('uq_player_stats_player_season', 'player_stats', ['player_id', 'season'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_player_stats_player_season', 'player_stats', type_='unique')
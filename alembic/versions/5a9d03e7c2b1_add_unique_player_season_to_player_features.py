@@ -0,0 +1,34 @@
+"""add unique (player_id, season) constraint to player_features
+
+Revision ID: 5a9d03e7c2b1
+Revises: b84e2c61f0d3
+Create Date: 2026-10-16 14:37:05.662419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5a9d03e7c2b1'
+down_revision = 'b84e2c61f0d3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Keep the most recent row for any duplicated (player_id, season) pair
+    op.execute(
+        """
+        DELETE FROM player_features a
+        USING player_features b
+        WHERE a.player_id = b.player_id
+          AND a.season = b.season
+          AND a.feature_id < b.feature_id
+        """
+    )
+    op.create_unique_constraint('uq_player_features_player_season', 'player_features', ['player_id', 'season'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_player_features_player_season', 'player_features', type_='unique')
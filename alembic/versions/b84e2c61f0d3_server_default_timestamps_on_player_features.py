@@ -0,0 +1,26 @@
+"""server-side default timestamps on player_features
+
+Revision ID: b84e2c61f0d3
+Revises: 3f1c2a7d9e40
+Create Date: 2026-10-16 14:02:31.508214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b84e2c61f0d3'
+down_revision = '3f1c2a7d9e40'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('player_features', 'created_at', server_default=sa.text("timezone('utc', now())"))
+    op.alter_column('player_features', 'updated_at', server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    op.alter_column('player_features', 'updated_at', server_default=None)
+    op.alter_column('player_features', 'created_at', server_default=None)
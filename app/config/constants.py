@@ -42,6 +42,9 @@ SUPPORTED_SEASONS = [
     "2023-24"
 ]
 
+# O(1) membership checks against SUPPORTED_SEASONS
+SUPPORTED_SEASONS_SET = frozenset(SUPPORTED_SEASONS)
+
 # Fantasy scoring weights
 FANTASY_SCORING = {
     "points": 1.0,
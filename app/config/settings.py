@@ -37,6 +37,7 @@ LOG_FILE = LOGS_DIR / "app.log"
 # Cache configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))  # 1 hour default
+FEATURE_CACHE_DIR = DATA_DIR / "feature_cache"  # Parquet snapshots of computed z-scores
 
 # Feature flags
 ENABLE_CACHING = os.getenv("ENABLE_CACHING", "true").lower() == "true"
@@ -2,17 +2,78 @@
 Fetch and clean NBA season statistics.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing import Optional
 
-from app.utils.api import make_nba_request
+from app.utils.api import make_nba_request, make_nba_request_async
 from app.utils.validation import validate_season_format, validate_player_stats
 from app.utils.logging import setup_logger, log_execution_time, log_error_with_context
+from app.utils.cache import redis_cache
 from app.config.constants import FANTASY_SCORING
 
 # Set up logger
 logger = setup_logger(__name__)
 
+# Columns of leaguedashplayerstats actually consumed downstream
+# (clean_player_stats + extract_player_data), with their Arrow types
+STATS_SCHEMA = pa.schema([
+    ("PLAYER_ID", pa.int32()),
+    ("PLAYER_NAME", pa.string()),
+    ("TEAM_ABBREVIATION", pa.string()),
+    ("GP", pa.int16()),
+    ("MIN", pa.float64()),
+    ("PTS", pa.float64()),
+    ("REB", pa.float64()),
+    ("AST", pa.float64()),
+    ("STL", pa.float64()),
+    ("BLK", pa.float64()),
+    ("TOV", pa.float64()),
+    ("FG_PCT", pa.float64()),
+    ("FT_PCT", pa.float64()),
+    ("FG3M", pa.float64()),
+])
+
+# NBA API column -> PlayerStats column
+STATS_RENAME_MAP = {
+    "PLAYER_ID": "player_id",
+    "TEAM_ABBREVIATION": "team",
+    "GP": "games_played",
+    "MIN": "minutes_per_game",
+    "PTS": "points_per_game",
+    "REB": "rebounds_per_game",
+    "AST": "assists_per_game",
+    "STL": "steals_per_game",
+    "BLK": "blocks_per_game",
+    "TOV": "turnovers_per_game",
+    "FG_PCT": "fg_pct",
+    "FT_PCT": "ft_pct",
+    "FG3M": "three_pm"
+}
+STATS_SOURCE_COLUMNS = list(STATS_RENAME_MAP)
+
+def result_set_to_frame(result_set: dict, schema: pa.Schema = STATS_SCHEMA) -> pd.DataFrame:
+    """
+    Build a typed DataFrame from an NBA API result set, keeping only schema columns.
+    
+    Args:
+        result_set (dict): One entry of response["resultSets"]
+        schema (pa.Schema): Columns to keep and their types
+        
+    Returns:
+        pd.DataFrame: Projected DataFrame with pre-declared dtypes
+    """
+    positions = {name: i for i, name in enumerate(result_set["headers"])}
+    rows = result_set["rowSet"]
+    
+    arrays = [
+        pa.array([row[positions[field.name]] for row in rows], type=field.type)
+        for field in schema
+    ]
+    return pa.Table.from_arrays(arrays, schema=schema).to_pandas()
+
+@redis_cache(key=lambda season="2023-24": f"nba:stats:{season}")
 def fetch_nba_stats(season: str = "2023-24") -> pd.DataFrame:
     """
     Fetch player stats from NBA API for a given season.
@@ -21,7 +82,7 @@ def fetch_nba_stats(season: str = "2023-24") -> pd.DataFrame:
         season (str): Season in format '2023-24'
         
     Returns:
-        pd.DataFrame: Raw stats data
+        pd.DataFrame: Raw stats data (STATS_SCHEMA columns only)
         
     Raises:
         ValueError: If season format is invalid
@@ -43,13 +104,10 @@ def fetch_nba_stats(season: str = "2023-24") -> pd.DataFrame:
         
         response = make_nba_request("leaguedashplayerstats", params)
         
-        headers = response["resultSets"][0]["headers"]
-        rows = response["resultSets"][0]["rowSet"]
-        
-        df = pd.DataFrame(rows, columns=headers)
+        df = result_set_to_frame(response["resultSets"][0])
         
         log_execution_time(logger, start_time, f"Fetched NBA stats for {season}")
-        logger.info(f"✅ Retrieved {len(df)} player records")
+        logger.info("✅ Retrieved %s player records", len(df))
         
         return df
         
@@ -65,6 +123,57 @@ def fetch_nba_stats(season: str = "2023-24") -> pd.DataFrame:
         )
         raise
 
+@redis_cache(key=lambda session, season="2023-24": f"nba:stats:{season}")
+async def fetch_nba_stats_async(session, season: str = "2023-24") -> pd.DataFrame:
+    """
+    Async variant of fetch_nba_stats sharing one aiohttp session across calls.
+    
+    Args:
+        session (aiohttp.ClientSession): Shared NBA API session
+        season (str): Season in format '2023-24'
+        
+    Returns:
+        pd.DataFrame: Raw stats data (STATS_SCHEMA columns only)
+        
+    Raises:
+        ValueError: If season format is invalid
+    """
+    if not validate_season_format(season):
+        raise ValueError(f"Invalid season format: {season}. Expected format: YYYY-YY")
+
+    params = {
+        "Season": season,
+        "SeasonType": "Regular Season",
+        "MeasureType": "Base",
+        "PerMode": "PerGame",
+        "LeagueID": "00"
+    }
+    
+    try:
+        import time
+        start_time = time.time()
+        
+        response = await make_nba_request_async(session, "leaguedashplayerstats", params)
+        
+        df = result_set_to_frame(response["resultSets"][0])
+        
+        log_execution_time(logger, start_time, f"Fetched NBA stats for {season}")
+        logger.info("✅ Retrieved %s player records", len(df))
+        
+        return df
+        
+    except Exception as e:
+        log_error_with_context(
+            logger,
+            e,
+            context={
+                "operation": "fetch_nba_stats_async",
+                "season": season,
+                "params": params
+            }
+        )
+        raise
+
 def clean_player_stats(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean and normalize player stats data.
@@ -78,35 +187,18 @@ def clean_player_stats(df: pd.DataFrame) -> pd.DataFrame:
     Raises:
         ValueError: If DataFrame fails validation
     """
-    # Drop exact duplicate rows
-    df = df.drop_duplicates(subset=["PLAYER_ID"])
-
     # Remove rows with obviously broken data
     df = df[df["GP"] > 0]  # Must have played at least 1 game
 
-    # Ensure percentages are within 0–1 (sometimes they appear as 100-based)
-    df["FG_PCT"] = df["FG_PCT"].apply(lambda x: x if 0 <= x <= 1 else x / 100)
-    df["FT_PCT"] = df["FT_PCT"].apply(lambda x: x if 0 <= x <= 1 else x / 100)
+    # Drop exact duplicate rows (after the filter so there are fewer rows to hash)
+    df = df.drop_duplicates(subset=["PLAYER_ID"])
 
-    # Normalize column names to match your PlayerStats table
-    rename_map = {
-        "PLAYER_ID": "player_id",
-        "TEAM_ABBREVIATION": "team",
-        "GP": "games_played",
-        "MIN": "minutes_per_game",
-        "PTS": "points_per_game",
-        "REB": "rebounds_per_game",
-        "AST": "assists_per_game",
-        "STL": "steals_per_game",
-        "BLK": "blocks_per_game",
-        "TOV": "turnovers_per_game",
-        "FG_PCT": "fg_pct",
-        "FT_PCT": "ft_pct",
-        "FG3M": "three_pm"
-    }
+    # Ensure percentages are within 0–1 (sometimes they appear as 100-based)
+    for col in ("FG_PCT", "FT_PCT"):
+        df[col] = np.where(df[col] > 1, df[col] / 100, df[col])
 
-    df = df.rename(columns=rename_map)
-    df = df[list(rename_map.values())]
+    # Project to the kept columns first, then normalize names to match PlayerStats
+    df = df.loc[:, STATS_SOURCE_COLUMNS].rename(columns=STATS_RENAME_MAP)
     
     # Validate the cleaned DataFrame
     errors = validate_player_stats(df)
@@ -114,7 +206,7 @@ def clean_player_stats(df: pd.DataFrame) -> pd.DataFrame:
         logger.error("❌ Player stats validation failed", extra={"errors": errors})
         raise ValueError(f"Player stats validation failed: {errors}")
     
-    logger.info(f"✅ Cleaned & normalized {len(df)} player records")
+    logger.info("✅ Cleaned & normalized %s player records", len(df))
     return df
 
 if __name__ == "__main__":
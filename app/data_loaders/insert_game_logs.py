@@ -2,6 +2,7 @@ import sys
 import os
 import time
 import datetime
+from typing import Iterable, Iterator
 import requests
 import pandas as pd
 from sqlalchemy.orm import Session
@@ -11,6 +12,8 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
 from app.db.connection import SessionLocal
+from app.utils.api import make_nba_request_async
+from app.utils.db import copy_dataframe
 from app.models.models import PlayerGameStats
 
 
@@ -26,6 +29,10 @@ HEADERS = {
 
 URL = "https://stats.nba.com/stats/playergamelogs"
 
+# Rows per normalized/COPY chunk. Only the normalized frame and COPY buffer
+# are bounded by this; the raw API payload is still held in full
+CHUNK_SIZE = 50_000
+
 PARAMS = {
     "Season": "2023-24",
     "SeasonType": "Regular Season",
@@ -48,7 +55,31 @@ def fetch_player_game_logs(season="2023-24"):
     return df
 
 
-def normalize_game_log_data(df):
+async def fetch_player_game_logs_async(session, season="2023-24"):
+    print(f"⏳ Fetching game logs for {season} from NBA stats API...")
+    params = PARAMS.copy()
+    params["Season"] = season
+    data = await make_nba_request_async(session, "playergamelogs", params)
+
+    headers = data["resultSets"][0]["headers"]
+    rows = data["resultSets"][0]["rowSet"]
+    df = pd.DataFrame(rows, columns=headers)
+    print(f"✅ Retrieved {len(df)} rows of player game logs.")
+    return df
+
+
+def normalize_game_log_data(df, chunk_size=CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield normalized game logs in chunks of at most chunk_size rows.
+    
+    df is the full raw season payload; chunking caps the normalized copy
+    and the COPY buffer built from it, not the raw frame itself.
+    """
+    for start in range(0, len(df), chunk_size):
+        yield normalize_game_log_chunk(df.iloc[start:start + chunk_size])
+
+
+def normalize_game_log_chunk(df):
     df_clean = pd.DataFrame()
     df_clean["player_id"] = df["PLAYER_ID"]
     df_clean["game_date"] = pd.to_datetime(df["GAME_DATE"])
@@ -82,14 +113,12 @@ def normalize_game_log_data(df):
     return df_clean
 
 
-def insert_player_game_logs(df_clean):
+def insert_player_game_logs(chunks: Iterable[pd.DataFrame]):
     session: Session = SessionLocal()
     try:
         count = 0
-        for _, row in df_clean.iterrows():
-            record = PlayerGameStats(**row.to_dict())
-            session.add(record)
-            count += 1
+        for df_chunk in chunks:
+            count += copy_dataframe(session, PlayerGameStats.__tablename__, df_chunk)
         session.commit()
         print(f"✅ Inserted {count} game log records into player_game_stats.")
     except Exception as e:
@@ -101,5 +130,5 @@ def insert_player_game_logs(df_clean):
 
 if __name__ == "__main__":
     df_raw = fetch_player_game_logs()
-    df_clean = normalize_game_log_data(df_raw)
-    insert_player_game_logs(df_clean)
+    log_chunks = normalize_game_log_data(df_raw)
+    insert_player_game_logs(log_chunks)
@@ -15,19 +15,20 @@ SEASONS = ["2018-19", "2019-20", "2020-21", "2021-22", "2022-23", "2023-24"]
 
 def build_season_info_rows(session: Session, season: str):
     # Use player_stats to determine active players that season
-    stats = session.query(PlayerStats).filter(PlayerStats.season == season).all()
-    rows = []
-    for s in stats:
-        row = PlayerSeasonInfo(
-            player_id=s.player_id,
+    player_ids = session.query(PlayerStats.player_id).filter(PlayerStats.season == season).all()
+    # One timestamp for the whole season (naive UTC, like the DateTime columns)
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+    return [
+        dict(
+            player_id=player_id,
             season=season,
             adp=999,  # Placeholder
             injury_notes=None,  # Placeholder
-            created_at=datetime.datetime.utcnow(),
-            updated_at=datetime.datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
         )
-        rows.append(row)
-    return rows
+        for (player_id,) in player_ids
+    ]
 
 def insert_season_info(seasons):
     session: Session = SessionLocal()
@@ -37,10 +38,9 @@ def insert_season_info(seasons):
             rows = build_season_info_rows(session, season)
 
             # Delete any existing rows for this season
-            session.query(PlayerSeasonInfo).filter(PlayerSeasonInfo.season == season).delete()
+            session.query(PlayerSeasonInfo).filter(PlayerSeasonInfo.season == season).delete(synchronize_session=False)
 
-            for row in rows:
-                session.add(row)
+            session.bulk_insert_mappings(PlayerSeasonInfo, rows)
             session.commit()
             print(f"✅ Inserted {len(rows)} player_season_info rows for {season}")
     except Exception as e:
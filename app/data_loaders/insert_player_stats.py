@@ -1,6 +1,7 @@
 import sys
 import os
 import pandas as pd
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 # Add the project root directory to the Python path
@@ -10,39 +11,58 @@ sys.path.insert(0, project_root)
 import datetime
 from app.db.connection import SessionLocal
 from app.models.models import PlayerStats
+from app.utils.db import copy_dataframe
 from app.data_loaders.fetch_season_stats import fetch_nba_stats, clean_player_stats
 
+# Conflict target for the upsert (backed by uq_player_stats_player_season)
+CONFLICT_COLUMNS = ("player_id", "season")
+
+# Session-local staging table that COPY loads into before the merge
+STAGING_TABLE = "player_stats_staging"
+
+
+def copy_to_staging(session: Session, df: pd.DataFrame, columns: list):
+    """COPY a DataFrame into the temp staging table via an in-memory CSV buffer."""
+    column_list = ", ".join(columns)
+    session.execute(text(
+        f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS "
+        f"SELECT {column_list} FROM {PlayerStats.__tablename__} WITH NO DATA"
+    ))
+
+    copy_dataframe(session, STAGING_TABLE, df[columns])
+
 
 def insert_player_stats(df, season="2023-24"):
     session: Session = SessionLocal()
 
     try:
-        for _, row in df.iterrows():
-            stat = PlayerStats(
-                player_id=row["player_id"],
-                season=season,
-                team=row["team"],
-                games_played=row["games_played"],
-                minutes_per_game=row["minutes_per_game"],
-                points_per_game=row["points_per_game"],
-                rebounds_per_game=row["rebounds_per_game"],
-                assists_per_game=row["assists_per_game"],
-                steals_per_game=row["steals_per_game"],
-                blocks_per_game=row["blocks_per_game"],
-                turnovers_per_game=row["turnovers_per_game"],
-                fg_pct=row["fg_pct"],
-                ft_pct=row["ft_pct"],
-                three_pm=row["three_pm"],
-                last_updated=datetime.datetime.utcnow(),
-            )
-
-            # Upsert logic: delete existing record for this player + season first
-            session.query(PlayerStats).filter(
-                PlayerStats.player_id == stat.player_id,
-                PlayerStats.season == season
-            ).delete()
-
-            session.add(stat)
+        if df.empty:
+            print(f"⚠️ No PlayerStats rows to insert for {season}.")
+            return
+
+        df_load = df.assign(
+            season=season,
+            last_updated=datetime.datetime.utcnow(),
+        )
+        columns = list(df_load.columns)
+        column_list = ", ".join(columns)
+        update_list = ", ".join(
+            f"{c} = EXCLUDED.{c}" for c in columns if c not in CONFLICT_COLUMNS
+        )
+
+        # COPY the season into staging, then merge it with one INSERT ... SELECT
+        copy_to_staging(session, df_load, columns)
+        session.execute(text(
+            f"INSERT INTO {PlayerStats.__tablename__} ({column_list}) "
+            f"SELECT {column_list} FROM {STAGING_TABLE} "
+            f"ON CONFLICT ({', '.join(CONFLICT_COLUMNS)}) DO UPDATE SET {update_list}"
+        ))
+
+        # One season-scoped DELETE for players that dropped out of this fetch
+        session.query(PlayerStats).filter(
+            PlayerStats.season == season,
+            PlayerStats.player_id.notin_(df_load["player_id"].tolist())
+        ).delete(synchronize_session=False)
 
         session.commit()
         print(f"✅ Inserted {len(df)} PlayerStats rows into DB.")
@@ -8,7 +8,7 @@ import pandas as pd
 
 from app.models.models import Player
 from app.utils.db import get_db, safe_commit, batch_upsert
-from app.utils.data_cleaning import clean_player_name, map_position
+from app.utils.data_cleaning import clean_player_names, map_position
 from app.utils.logging import setup_logger
 from app.data_loaders.fetch_season_stats import fetch_nba_stats
 
@@ -25,18 +25,21 @@ def extract_player_data(df_raw: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned player DataFrame
     """
-    # Extract only available fields from the NBA stats API
-    players_df = df_raw[["PLAYER_ID", "PLAYER_NAME", "TEAM_ABBREVIATION"]].drop_duplicates()
+    # Extract only available fields from the NBA stats API,
+    # one row per player (keeping the latest team for mid-season trades)
+    players_df = df_raw.groupby("PLAYER_ID", sort=False, as_index=False).agg(
+        {"PLAYER_NAME": "first", "TEAM_ABBREVIATION": "last"}
+    )
     
     # Clean player names and map positions
-    players_df["name"] = players_df["PLAYER_NAME"].apply(clean_player_name)
+    players_df["name"] = clean_player_names(players_df["PLAYER_NAME"])
     players_df["position"] = None  # Will be updated by backfill_positions.py
     
     # Rename columns
     players_df.columns = ["player_id", "raw_name", "team", "position"]
     players_df = players_df.drop(columns=["raw_name"])
     
-    logger.info(f"✅ Extracted {len(players_df)} unique player records")
+    logger.info("✅ Extracted %s unique player records", len(players_df))
     return players_df
 
 def create_player_records(df_players: pd.DataFrame) -> List[Player]:
@@ -49,21 +52,21 @@ def create_player_records(df_players: pd.DataFrame) -> List[Player]:
     Returns:
         List[Player]: List of Player model instances
     """
-    now = datetime.datetime.utcnow()
+    # Naive UTC, like the DateTime columns (utcnow() is deprecated in 3.12)
+    now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
     
-    records = []
-    for _, row in df_players.iterrows():
-        player = Player(
-            player_id=row["player_id"],
-            name=row["name"],
-            team=row["team"],
-            position=row["position"],
+    columns = df_players[["player_id", "name", "team", "position"]]
+    return [
+        Player(
+            player_id=player_id,
+            name=name,
+            team=team,
+            position=position,
             created_at=now,
             updated_at=now,
         )
-        records.append(player)
-    
-    return records
+        for player_id, name, team, position in columns.itertuples(index=False, name=None)
+    ]
 
 def insert_players(df_players: pd.DataFrame, batch_size: int = 100) -> bool:
     """
@@ -82,14 +85,14 @@ def insert_players(df_players: pd.DataFrame, batch_size: int = 100) -> bool:
             success = batch_upsert(session, Player, records, batch_size)
             
             if success:
-                logger.info(f"✅ Successfully inserted {len(records)} player records")
+                logger.info("✅ Successfully inserted %s player records", len(records))
             else:
                 logger.error("❌ Failed to insert player records")
             
             return success
             
         except Exception as e:
-            logger.error(f"❌ Error inserting players: {e}")
+            logger.error("❌ Error inserting players: %s", e)
             return False
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
 from app.db.connection import SessionLocal
+from app.utils.api import make_nba_request_async
 from app.models.models import TeamSchedule
 
 HEADERS = {
@@ -50,6 +51,19 @@ def fetch_team_schedule(season="2023-24"):
     return df
 
 
+async def fetch_team_schedule_async(session, season="2023-24"):
+    print(f"⏳ Fetching team schedule for {season} from NBA stats API...")
+    params = PARAMS.copy()
+    params["Season"] = season
+    data = await make_nba_request_async(session, "leaguegamefinder", params)
+
+    headers = data["resultSets"][0]["headers"]
+    rows = data["resultSets"][0]["rowSet"]
+    df = pd.DataFrame(rows, columns=headers)
+    print(f"✅ Retrieved {len(df)} team schedule rows.")
+    return df
+
+
 def normalize_team_schedule(df, season="2023-24"):
     df["GAME_DATE"] = pd.to_datetime(df["GAME_DATE"])
     df["home_or_away"] = df["MATCHUP"].apply(lambda x: "H" if "vs." in x else "A")
@@ -80,6 +94,11 @@ def insert_team_schedule(df_clean):
             record = TeamSchedule(**row.to_dict())
             session.add(record)
             count += 1
+
+        # Pipeline mode lets psycopg send the flush's INSERTs without
+        # waiting for each round trip
+        with session.connection().connection.driver_connection.pipeline():
+            session.flush()
         session.commit()
         print(f"✅ Inserted {count} schedule rows into team_schedule.")
     except Exception as e:
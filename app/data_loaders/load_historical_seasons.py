@@ -1,46 +1,60 @@
 import sys
 import os
-import time
+import asyncio
 
 # Set up project path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
-from app.etl.insert_players import insert_players, extract_player_data
-from app.etl.insert_player_stats import insert_player_stats
-from app.etl.insert_game_logs import fetch_player_game_logs, normalize_game_log_data, insert_player_game_logs
-from app.etl.insert_team_schedule import fetch_team_schedule, normalize_team_schedule, insert_team_schedule
-from app.data_loaders.fetch_season_stats import fetch_nba_stats, clean_player_stats
+from app.utils.api import create_nba_client_session
+from app.data_loaders.insert_players import insert_players, extract_player_data
+from app.data_loaders.insert_player_stats import insert_player_stats
+from app.data_loaders.insert_game_logs import fetch_player_game_logs_async, normalize_game_log_data, insert_player_game_logs
+from app.data_loaders.insert_team_schedule import fetch_team_schedule_async, normalize_team_schedule, insert_team_schedule
+from app.data_loaders.fetch_season_stats import fetch_nba_stats_async, clean_player_stats
 
 SEASONS = ["2022-23", "2021-22", "2020-21", "2019-20", "2018-19"]
 
-def load_all_data_for_season(season):
-    print(f"📦 Loading data for {season}...")
+# Max seasons hitting the NBA API at once (stats.nba.com rate-limits aggressively)
+MAX_CONCURRENT_SEASONS = 2
 
-    # 1. Player Stats
-    df_stats_raw = fetch_nba_stats(season=season)
-    df_stats_clean = clean_player_stats(df_stats_raw)
-    insert_player_stats(df_stats_clean, season)
 
-    # 2. Players (upsert safe)
-    df_players = extract_player_data(df_stats_raw)
-    insert_players(df_players)
+async def load_all_data_for_season_async(season, session, semaphore):
+    async with semaphore:
+        print(f"📦 Loading data for {season}...")
 
-    # 3. Game Logs
-    df_logs_raw = fetch_player_game_logs(season)
-    df_logs_clean = normalize_game_log_data(df_logs_raw)
-    insert_player_game_logs(df_logs_clean)
+        # 1. Player Stats
+        df_stats_raw = await fetch_nba_stats_async(session, season=season)
+        df_stats_clean = clean_player_stats(df_stats_raw)
+        await asyncio.to_thread(insert_player_stats, df_stats_clean, season)
 
-    # 4. Schedule
-    df_sched_raw = fetch_team_schedule(season)
-    df_sched_clean = normalize_team_schedule(df_sched_raw, season)
-    insert_team_schedule(df_sched_clean)
+        # 2. Players (upsert safe)
+        df_players = extract_player_data(df_stats_raw)
+        await asyncio.to_thread(insert_players, df_players)
+
+        # 3. Game Logs
+        df_logs_raw = await fetch_player_game_logs_async(session, season)
+        log_chunks = normalize_game_log_data(df_logs_raw)
+        await asyncio.to_thread(insert_player_game_logs, log_chunks)
+
+        # 4. Schedule
+        df_sched_raw = await fetch_team_schedule_async(session, season)
+        df_sched_clean = normalize_team_schedule(df_sched_raw, season)
+        await asyncio.to_thread(insert_team_schedule, df_sched_clean)
+
+
+async def load_historical_seasons(seasons=SEASONS):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEASONS)
+
+    # One ClientSession for every season so TCP+TLS connections are reused
+    async with create_nba_client_session() as session:
+        tasks = [load_all_data_for_season_async(s, session, semaphore) for s in seasons]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for season, result in zip(seasons, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed to load {season}: {result}")
 
-    time.sleep(1)  # Avoid hammering the NBA API
 
 if __name__ == "__main__":
-    for season in SEASONS:
-        try:
-            load_all_data_for_season(season)
-        except Exception as e:
-            print(f"❌ Failed to load {season}: {e}")
\ No newline at end of file
+    asyncio.run(load_historical_seasons())
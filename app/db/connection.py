@@ -1,24 +1,21 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.engine import URL
-from dotenv import load_dotenv
-import os
+from sqlalchemy.engine import make_url
 
-# Load environment variables from .env
-load_dotenv()
+from app.config.settings import DATABASE_URL
 
-# Create the connection URL using components
-connection_url = URL.create(
-    drivername="postgresql",
-    username="postgres.rajazhsbfwxgznzgrfdh",
-    password="y42-wQce@Nv!Ka&",
-    host="aws-0-us-east-1.pooler.supabase.com",
-    port=5432,
-    database="postgres",
-    query={"sslmode": "require"}
-)
+# Credentials come from DATABASE_URL (.env); force the psycopg 3 driver
+# (COPY + pipeline support) regardless of the scheme used there
+connection_url = make_url(DATABASE_URL).set(drivername="postgresql+psycopg")
 
-engine = create_engine(connection_url)
+# Single process-wide engine/pool shared by the API and every ETL script
+engine = create_engine(
+    connection_url,
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def get_db():
@@ -2,23 +2,62 @@
 
 import time
 import random
-from typing import Optional
+import asyncio
+from typing import List, Optional, Tuple
 
-from sqlalchemy import update
+from sqlalchemy import bindparam
 from app.models.models import Player
-from app.utils.api import make_nba_request
+from app.utils.api import make_nba_request_async, create_nba_client_session
 from app.utils.db import get_db, safe_commit
 from app.utils.data_cleaning import map_position
 from app.utils.logging import setup_logger, log_execution_time, log_error_with_context
+from app.utils.cache import redis_cache
 
 # Set up logger
 logger = setup_logger(__name__)
 
-def fetch_player_position(player_id: int) -> Optional[str]:
+# Concurrent commonplayerinfo requests in flight (stats.nba.com tolerates ~4)
+MAX_CONCURRENT_REQUESTS = 4
+
+# Positions rarely change, cache lookups for a week
+POSITION_CACHE_TTL = 7 * 24 * 60 * 60
+
+def parse_player_position(response: dict, player_id: int) -> str:
     """
-    Fetch player position from NBA API.
+    Extract the mapped position from a commonplayerinfo response.
     
     Args:
+        response (dict): commonplayerinfo JSON payload
+        player_id (int): NBA player ID (for logging)
+        
+    Returns:
+        str: Player position, or "UNK" if missing
+    """
+    headers = response['resultSets'][0]['headers']
+    row = response['resultSets'][0]['rowSet'][0]
+    
+    if "POSITION" in headers:
+        position_index = headers.index("POSITION")
+        raw_position = row[position_index]
+        return map_position(raw_position) if raw_position else "UNK"
+    else:
+        logger.warning("⚠️ 'POSITION' field missing for Player ID %s", player_id)
+        return "UNK"
+
+@redis_cache(
+    key=lambda client, player_id: f"nba:pos:{player_id}",
+    ttl=POSITION_CACHE_TTL,
+    serialize=str.encode,
+    deserialize=bytes.decode,
+    # "UNK" is also the failure fallback, don't pin it for a week
+    should_cache=lambda position: bool(position) and position != "UNK"
+)
+async def fetch_player_position_async(client, player_id: int) -> Optional[str]:
+    """
+    Fetch player position from NBA API using a shared aiohttp session.
+    
+    Args:
+        client (aiohttp.ClientSession): Shared NBA API session
         player_id (int): NBA player ID
         
     Returns:
@@ -26,30 +65,45 @@ def fetch_player_position(player_id: int) -> Optional[str]:
     """
     try:
         params = {"PlayerID": player_id}
-        response = make_nba_request("commonplayerinfo", params)
-        
-        headers = response['resultSets'][0]['headers']
-        row = response['resultSets'][0]['rowSet'][0]
-        
-        if "POSITION" in headers:
-            position_index = headers.index("POSITION")
-            raw_position = row[position_index]
-            return map_position(raw_position) if raw_position else "UNK"
-        else:
-            logger.warning(f"⚠️ 'POSITION' field missing for Player ID {player_id}")
-            return "UNK"
+        response = await make_nba_request_async(client, "commonplayerinfo", params)
+        return parse_player_position(response, player_id)
             
     except Exception as e:
         log_error_with_context(
             logger,
             e,
             context={
-                "operation": "fetch_player_position",
+                "operation": "fetch_player_position_async",
                 "player_id": player_id
             }
         )
         return "UNK"
 
+async def fetch_batch_positions(players: list) -> List[Tuple[Player, str]]:
+    """
+    Fetch positions for a batch of players with a bounded worker pool.
+    
+    Args:
+        players (list): List of Player instances
+        
+    Returns:
+        List[Tuple[Player, str]]: (player, position) pairs in completion order
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    updates = []
+    
+    async with create_nba_client_session() as client:
+        async def worker(player):
+            # make_nba_request_async sleeps 0.5-1.5s while holding the slot,
+            # which keeps the per-host request rate polite
+            async with semaphore:
+                position = await fetch_player_position_async(client, player.player_id)
+            updates.append((player, position))
+        
+        await asyncio.gather(*(worker(p) for p in players))
+    
+    return updates
+
 def backfill_positions(batch_size: int = 50) -> bool:
     """
     Backfill missing player positions in batches.
@@ -70,7 +124,7 @@ def backfill_positions(batch_size: int = 50) -> bool:
             ).all()
             
             total_players = len(players)
-            logger.info(f"🔍 Found {total_players} players to update")
+            logger.info("🔍 Found %s players to update", total_players)
             
             if not total_players:
                 logger.info("✨ No players need position updates")
@@ -79,13 +133,13 @@ def backfill_positions(batch_size: int = 50) -> bool:
             # Process in batches
             for i in range(0, total_players, batch_size):
                 batch = players[i:i + batch_size]
-                logger.info(f"\n📦 Processing batch {i//batch_size + 1} of {(total_players + batch_size - 1)//batch_size}")
+                logger.info("\n📦 Processing batch %s of %s", i//batch_size + 1, (total_players + batch_size - 1)//batch_size)
                 
                 batch_start = time.time()
                 success = process_batch(session, batch)
                 
                 if not success:
-                    logger.error(f"❌ Failed to process batch {i//batch_size + 1}")
+                    logger.error("❌ Failed to process batch %s", i//batch_size + 1)
                     return False
                 
                 log_execution_time(logger, batch_start, f"Processed batch {i//batch_size + 1}")
@@ -93,7 +147,7 @@ def backfill_positions(batch_size: int = 50) -> bool:
                 # Random delay between batches (3-5 seconds)
                 if i + batch_size < total_players:
                     delay = random.uniform(3, 5)
-                    logger.info(f"😴 Sleeping for {delay:.1f} seconds before next batch...")
+                    logger.info("😴 Sleeping for %.1f seconds before next batch...", delay)
                     time.sleep(delay)
             
             logger.info("\n✅ Successfully completed position backfill!")
@@ -122,19 +176,19 @@ def process_batch(session, players: list) -> bool:
         bool: True if successful, False if failed
     """
     try:
-        for idx, player in enumerate(players, 1):
-            position = fetch_player_position(player.player_id)
-            
-            session.execute(
-                update(Player)
-                .where(Player.player_id == player.player_id)
-                .values(position=position)
-            )
-            
-            logger.info(f"[{idx}/{len(players)}] Updated {player.name} ({player.player_id}) to position: {position}")
-            
-            # Random delay between requests (1-2 seconds)
-            time.sleep(1 + random.random())
+        updates = asyncio.run(fetch_batch_positions(players))
+        
+        for idx, (player, position) in enumerate(updates, 1):
+            logger.info("[%s/%s] Updated %s (%s) to position: %s", idx, len(players), player.name, player.player_id, position)
+        
+        # One executemany UPDATE for the whole batch
+        players_table = Player.__table__
+        session.execute(
+            players_table.update()
+            .where(players_table.c.player_id == bindparam("b_pid"))
+            .values(position=bindparam("pos")),
+            [{"b_pid": player.player_id, "pos": position} for player, position in updates]
+        )
         
         return safe_commit(session, f"Failed to commit batch of {len(players)} players")
         
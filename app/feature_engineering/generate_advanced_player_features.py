@@ -1,32 +1,116 @@
 import sys
 import os
-import datetime
+import hashlib
 import pandas as pd
 import numpy as np
-from scipy.stats import zscore
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Dict, List, Optional
 
 # Add project root to Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
+from app.config.settings import ENABLE_CACHING, FEATURE_CACHE_DIR
 from app.db.connection import SessionLocal
 from app.models.models import PlayerStats, PlayerFeatures
 
-def fetch_player_stats_with_advanced(session: Session, season: str) -> pd.DataFrame:
+# Columns persisted to player_features
+FEATURE_Z_COLUMNS = [
+    "z_points", "z_rebounds", "z_assists", "z_steals", "z_blocks",
+    "z_turnovers", "z_fg_pct", "z_ft_pct", "z_three_pm", "total_z_score",
+]
+FEATURE_COLUMNS = ["player_id", "season", *FEATURE_Z_COLUMNS]
+
+# Basic 9-cat z-scores (traditional fantasy categories)
+BASIC_STATS = {
+    "points_per_game": "z_points",
+    "rebounds_per_game": "z_rebounds",
+    "assists_per_game": "z_assists",
+    "steals_per_game": "z_steals",
+    "blocks_per_game": "z_blocks",
+    "turnovers_per_game": "z_turnovers",  # Inverted
+    "fg_pct": "z_fg_pct",
+    "ft_pct": "z_ft_pct",
+    "three_pm": "z_three_pm"
+}
+
+# Advanced efficiency z-scores (missing values filled with the median)
+ADVANCED_STATS = {
+    "usage_rate": "z_usage_rate",
+    "true_shooting_pct": "z_true_shooting",
+    "player_efficiency_rating": "z_per",
+    "total_rebound_pct": "z_total_reb_pct",
+    "assist_pct": "z_assist_pct",
+    "steal_pct": "z_steal_pct",
+    "block_pct": "z_block_pct",
+    "turnover_pct": "z_turnover_pct"  # Inverted
+}
+
+# Per-36 z-scores (for comparing players with different minutes)
+PER36_STATS = {
+    "points_per_36": "z_points_per_36",
+    "rebounds_per_36": "z_rebounds_per_36",
+    "assists_per_36": "z_assists_per_36",
+    "steals_per_36": "z_steals_per_36",
+    "blocks_per_36": "z_blocks_per_36",
+    "turnovers_per_36": "z_turnovers_per_36"  # Inverted
+}
+
+# Stats where lower is better
+INVERTED_STATS = ("turnovers_per_game", "turnover_pct", "turnovers_per_36")
+
+# Composite weights: traditional stats, advanced efficiency, per-36 upside
+COMPOSITE_WEIGHTS = {"total_z_score": 0.6, "advanced_z_score": 0.3, "per36_z_score": 0.1}
+
+# Score columns produced from the z-score matrix, in _score_matrix() order
+SCORE_COLUMNS = ["total_z_score", "advanced_z_score", "per36_z_score", "composite_z_score"]
+
+# Everything compute_advanced_z_scores needs that doesn't depend on the data,
+# resolved once at import: column order, output names, signs, index arrays
+_RAW_COLS = [*BASIC_STATS, *ADVANCED_STATS, *PER36_STATS]
+_Z_COLS = [*BASIC_STATS.values(), *ADVANCED_STATS.values(), *PER36_STATS.values()]
+_SIGNS = np.array([-1.0 if c in INVERTED_STATS else 1.0 for c in _RAW_COLS], dtype=np.float32)
+_BASIC_IDX = np.array([_RAW_COLS.index(c) for c in BASIC_STATS], dtype=np.intp)
+_ADV_IDX = np.array([_RAW_COLS.index(c) for c in ADVANCED_STATS], dtype=np.intp)
+_P36_IDX = np.array([_RAW_COLS.index(c) for c in PER36_STATS], dtype=np.intp)
+
+def _score_matrix() -> np.ndarray:
     """
-    Fetch player stats including advanced metrics.
+    Build the (n_stats, 4) matrix mapping z-scores to SCORE_COLUMNS.
+    
+    The first three columns are 0/1 category indicators; the composite
+    column holds each stat's category weight.
     
-    Args:
-        session: Database session
-        season: NBA season (e.g., "2023-24")
-        
     Returns:
-        DataFrame with all player stats including advanced metrics
+        Matrix in _RAW_COLS row order
     """
-    query = text("""
+    matrix = np.zeros((len(_RAW_COLS), len(SCORE_COLUMNS)), dtype=np.float32)
+    category_idx = (_BASIC_IDX, _ADV_IDX, _P36_IDX)
+    for col, (idx, weight) in enumerate(zip(category_idx, COMPOSITE_WEIGHTS.values())):
+        matrix[idx, col] = 1.0
+        matrix[idx, 3] = weight
+    return matrix
+
+_SCORE_MATRIX = _score_matrix()
+
+# Age buckets (<=25, <=27, <=29, <=31, <=33, older) and their score multipliers
+AGE_BREAKPOINTS = np.array([25.0, 27.0, 29.0, 31.0, 33.0])
+AGE_FACTORS = np.array([1.1, 1.05, 1.0, 0.95, 0.9, 0.85])
+
+# Composite z-score thresholds and the tier each bucket maps to, lowest first
+TIER_THRESHOLDS = np.array([-2.0, 0.0, 2.0, 5.0, 8.0])
+TIER_LABELS = np.array([
+    "Waiver (Tier 6)",
+    "Streamer (Tier 5)",
+    "Decent (Tier 4)",
+    "Solid (Tier 3)",
+    "Star (Tier 2)",
+    "Elite (Tier 1)",
+])
+
+ADVANCED_STATS_SELECT = """
     SELECT 
         player_id, season, team, games_played, minutes_per_game,
         -- Basic stats
@@ -43,15 +127,151 @@ def fetch_player_stats_with_advanced(session: Session, season: str) -> pd.DataFr
         three_point_attempt_rate, free_throw_rate,
         offensive_rebound_pct, defensive_rebound_pct, total_rebound_pct,
         assist_pct, steal_pct, block_pct, turnover_pct
-    FROM player_stats 
-    WHERE season = :season
+    FROM player_stats
+"""
+
+def _build_advanced_z_score_query():
+    """
+    Build the SQL that computes advanced z-scores inside Postgres.
+    
+    Mirrors compute_advanced_z_scores: same qualifying filter and fallback,
+    NaNs filled with 0 (median for advanced stats), population std dev,
+    inverted turnover columns and weighted composite.
+    
+    Returns:
+        TextClause taking a :season parameter
+    """
+    all_stats = {**BASIC_STATS, **ADVANCED_STATS, **PER36_STATS}
+    
+    medians = ",\n            ".join(
+        f"PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {col}) AS {col}"
+        for col in ADVANCED_STATS
+    )
+    filled = ",\n            ".join(
+        f"COALESCE(p.{col}, m.{col}) AS {col}" if col in ADVANCED_STATS
+        else f"COALESCE(p.{col}, 0) AS {col}"
+        for col in all_stats
+    )
+    z_scores = ",\n            ".join(
+        f"{'-' if col in INVERTED_STATS else ''}(({col} - AVG({col}) OVER w)"
+        f" / NULLIF(STDDEV_POP({col}) OVER w, 0)) AS {z_col}"
+        for col, z_col in all_stats.items()
+    )
+    totals = {
+        "total_z_score": BASIC_STATS,
+        "advanced_z_score": ADVANCED_STATS,
+        "per36_z_score": PER36_STATS,
+    }
+    # Undefined z-scores (constant columns) count as 0 in the totals
+    sums = {
+        name: " + ".join(f"COALESCE({z_col}, 0)" for z_col in stats.values())
+        for name, stats in totals.items()
+    }
+    total_exprs = ",\n        ".join(f"({expr}) AS {name}" for name, expr in sums.items())
+    composite = " + ".join(
+        f"({sums[name]}) * {weight}" for name, weight in COMPOSITE_WEIGHTS.items()
+    )
+    
+    return text(f"""
+    WITH base AS (
+        SELECT * FROM player_stats WHERE season = :season
+    ),
+    pool AS (
+        SELECT * FROM base
+        WHERE CASE
+            WHEN (SELECT COUNT(*) FROM base
+                  WHERE minutes_per_game >= 15 AND games_played >= 20) >= 50
+            THEN minutes_per_game >= 15 AND games_played >= 20
+            ELSE games_played >= 10
+        END
+    ),
+    medians AS (
+        SELECT
+            {medians}
+        FROM pool
+    ),
+    filled AS (
+        SELECT
+            p.player_id, p.season, p.age,
+            {filled}
+        FROM pool p CROSS JOIN medians m
+    ),
+    z AS (
+        SELECT
+            player_id, season, age,
+            {z_scores}
+        FROM filled
+        WINDOW w AS (PARTITION BY season)
+    )
+    SELECT
+        z.*,
+        {total_exprs},
+        ({composite}) AS composite_z_score
+    FROM z
     """)
+
+ADVANCED_Z_SCORE_QUERY = _build_advanced_z_score_query()
+
+# Bump whenever compute_advanced_z_scores changes its output; together with the
+# stats query and column layout it keys the parquet snapshots, so stale ones
+# written by older compute logic are never served
+FEATURE_CACHE_VERSION = 2
+FEATURE_CACHE_KEY = hashlib.sha1(repr((
+    FEATURE_CACHE_VERSION, ADVANCED_STATS_SELECT, _RAW_COLS, _Z_COLS, SCORE_COLUMNS,
+)).encode()).hexdigest()[:12]
+
+def fetch_player_stats_with_advanced(session: Session, season: str) -> pd.DataFrame:
+    """
+    Fetch player stats including advanced metrics.
+    
+    Args:
+        session: Database session
+        season: NBA season (e.g., "2023-24")
+        
+    Returns:
+        DataFrame with all player stats including advanced metrics
+    """
+    query = text(f"{ADVANCED_STATS_SELECT} WHERE season = :season")
+    return pd.read_sql_query(query, session.connection(), params={"season": season})
+
+def fetch_player_stats_multi(session: Session, seasons: List[str]) -> pd.DataFrame:
+    """
+    Fetch player stats including advanced metrics for several seasons at once.
+    
+    Args:
+        session: Database session
+        seasons: NBA seasons (e.g., ["2022-23", "2023-24"])
+        
+    Returns:
+        DataFrame with all player stats for the requested seasons
+    """
+    query = text(f"{ADVANCED_STATS_SELECT} WHERE season = ANY(:seasons)")
+    return pd.read_sql_query(query, session.connection(), params={"seasons": list(seasons)})
+
+def fetch_advanced_z_scores(session: Session, season: str) -> pd.DataFrame:
+    """
+    Fetch advanced z-scores computed server-side.
+    
+    Equivalent to compute_advanced_z_scores(fetch_player_stats_with_advanced(...))
+    but only the qualified players' z-scores cross the wire.
+    
+    Args:
+        session: Database session
+        season: NBA season (e.g., "2023-24")
+        
+    Returns:
+        DataFrame with z-scores, category totals, composite and age-adjusted scores
+    """
+    z_df = pd.read_sql_query(
+        ADVANCED_Z_SCORE_QUERY, session.connection(), params={"season": season}
+    )
+    if z_df.empty:
+        return z_df
     
-    result = session.execute(query, {"season": season})
-    columns = result.keys()
-    data = [dict(zip(columns, row)) for row in result.fetchall()]
+    z_df = apply_age_adjustment(z_df)
     
-    return pd.DataFrame(data)
+    print(f"✅ Computed server-side z-scores for {len(z_df)} players")
+    return z_df
 
 def compute_advanced_z_scores(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -64,136 +284,120 @@ def compute_advanced_z_scores(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with comprehensive z-scores
     """
     # Filter for players with meaningful minutes (>= 15 MPG and >= 20 games)
-    qualified_df = df[
-        (df['minutes_per_game'] >= 15) & 
-        (df['games_played'] >= 20)
-    ].copy()
+    # Read-only from here on, so a boolean-indexed selection is enough (no copy)
+    mask = (df['minutes_per_game'] >= 15) & (df['games_played'] >= 20)
+    qualified_df = df.loc[mask]
     
     if len(qualified_df) < 50:  # Fallback if too restrictive
-        qualified_df = df[df['games_played'] >= 10].copy()
+        qualified_df = df.loc[df['games_played'] >= 10]
     
     print(f"Computing z-scores for {len(qualified_df)} qualified players")
     
-    # Basic 9-cat z-scores (traditional fantasy categories)
-    basic_stats = {
-        "points_per_game": "z_points",
-        "rebounds_per_game": "z_rebounds", 
-        "assists_per_game": "z_assists",
-        "steals_per_game": "z_steals",
-        "blocks_per_game": "z_blocks",
-        "turnovers_per_game": "z_turnovers",  # Inverted
-        "fg_pct": "z_fg_pct",
-        "ft_pct": "z_ft_pct",
-        "three_pm": "z_three_pm"
-    }
+    # Build one (n_players, n_stats) matrix and z-score every column at once
+    # float32 is plenty for ranking/tiering and halves the memory swept by
+    # the reductions; values are upcast to float64 when written to the DB
+    X = qualified_df.reindex(columns=_RAW_COLS).to_numpy(dtype=np.float32)
+    
+    # Missing values: 0 for counting/per-36 stats, column median for advanced
+    # stats; all medians come from one pass over the advanced block
+    fill_values = np.zeros(len(_RAW_COLS), dtype=np.float32)
+    missing = np.isnan(X)
+    if missing[:, _ADV_IDX].any():
+        adv = X[:, _ADV_IDX]
+        medians = np.nanmedian(np.where(missing[:, _ADV_IDX].all(axis=0), 0.0, adv), axis=0)
+        fill_values[_ADV_IDX] = medians
+    X = np.where(missing, fill_values, X)
+    
+    # Lower turnovers / turnover rate = better, hence the sign flips
+    Z = (X - X.mean(axis=0)) / X.std(axis=0, ddof=0) * _SIGNS
+    
+    z_df = pd.concat(
+        [
+            qualified_df[["player_id", "season"]],
+            pd.DataFrame(Z, columns=_Z_COLS, index=qualified_df.index),
+        ],
+        axis=1,
+    )
     
-    # Advanced efficiency z-scores
-    advanced_stats = {
-        "usage_rate": "z_usage_rate",
-        "true_shooting_pct": "z_true_shooting",
-        "player_efficiency_rating": "z_per",
-        "total_rebound_pct": "z_total_reb_pct",
-        "assist_pct": "z_assist_pct",
-        "steal_pct": "z_steal_pct",
-        "block_pct": "z_block_pct",
-        "turnover_pct": "z_turnover_pct"  # Inverted
-    }
+    # Category totals and the weighted composite in one matrix product:
+    # total (9-cat), advanced efficiency, per-36 upside, composite.
+    # A constant column has an undefined (NaN) z-score; it adds nothing.
+    z_df[SCORE_COLUMNS] = np.nan_to_num(Z) @ _SCORE_MATRIX
     
-    # Per-36 z-scores (for comparing players with different minutes)
-    per36_stats = {
-        "points_per_36": "z_points_per_36",
-        "rebounds_per_36": "z_rebounds_per_36",
-        "assists_per_36": "z_assists_per_36", 
-        "steals_per_36": "z_steals_per_36",
-        "blocks_per_36": "z_blocks_per_36",
-        "turnovers_per_36": "z_turnovers_per_36"  # Inverted
-    }
+    # Add age-adjusted scores for dynasty/keeper leagues
+    # z_df was built row-for-row from qualified_df, so age lines up positionally
+    if 'age' in qualified_df.columns:
+        assert len(z_df) == len(qualified_df)
+        z_df['age'] = qualified_df['age'].to_numpy()
+    z_df = apply_age_adjustment(z_df)
     
-    # Initialize result DataFrame
-    z_df = pd.DataFrame()
-    z_df["player_id"] = qualified_df["player_id"]
-    z_df["season"] = qualified_df["season"]
-    
-    # Compute basic z-scores
-    for raw_col, z_col in basic_stats.items():
-        if raw_col in qualified_df.columns:
-            values = qualified_df[raw_col].fillna(0)
-            if raw_col == "turnovers_per_game":
-                z_df[z_col] = -1 * zscore(values)  # Lower turnovers = better
-            else:
-                z_df[z_col] = zscore(values)
-        else:
-            z_df[z_col] = 0
-    
-    # Compute advanced z-scores
-    for raw_col, z_col in advanced_stats.items():
-        if raw_col in qualified_df.columns:
-            values = qualified_df[raw_col].fillna(qualified_df[raw_col].median())
-            if raw_col == "turnover_pct":
-                z_df[z_col] = -1 * zscore(values)  # Lower turnover rate = better
-            else:
-                z_df[z_col] = zscore(values)
-        else:
-            z_df[z_col] = 0
-    
-    # Compute per-36 z-scores
-    for raw_col, z_col in per36_stats.items():
-        if raw_col in qualified_df.columns:
-            values = qualified_df[raw_col].fillna(0)
-            if raw_col == "turnovers_per_36":
-                z_df[z_col] = -1 * zscore(values)  # Lower turnovers = better
-            else:
-                z_df[z_col] = zscore(values)
-        else:
-            z_df[z_col] = 0
+    print(f"✅ Computed enhanced z-scores for {len(z_df)} players")
+    return z_df
+
+def load_advanced_z_scores(session: Session, season: str) -> pd.DataFrame:
+    """
+    Compute advanced z-scores for a season, reusing a parquet snapshot when
+    player_stats hasn't changed since it was written.
     
-    # Calculate composite scores
+    Snapshots are keyed by season, MAX(last_updated) of that season's
+    player_stats rows and FEATURE_CACHE_KEY, so reloading stats or changing
+    the compute logic invalidates them automatically.
     
-    # Traditional 9-cat total (for standard leagues)
-    basic_z_cols = list(basic_stats.values())
-    z_df["total_z_score"] = z_df[basic_z_cols].sum(axis=1)
+    Args:
+        session: Database session
+        season: NBA season (e.g., "2023-24")
+        
+    Returns:
+        DataFrame with comprehensive z-scores (empty if no stats exist)
+    """
+    version = session.execute(
+        text("SELECT MAX(last_updated) FROM player_stats WHERE season = :season"),
+        {"season": season},
+    ).scalar()
+    if version is None:
+        return pd.DataFrame()
+    
+    cache_path = FEATURE_CACHE_DIR / (
+        f"{season}_{version:%Y%m%dT%H%M%S%f}_{FEATURE_CACHE_KEY}.parquet"
+    )
+    if ENABLE_CACHING and cache_path.exists():
+        print(f"📦 Loaded cached z-scores for {season} from {cache_path.name}")
+        return pd.read_parquet(cache_path)
     
-    # Advanced efficiency score (for deeper analysis)
-    advanced_z_cols = list(advanced_stats.values())
-    z_df["advanced_z_score"] = z_df[advanced_z_cols].sum(axis=1)
+    print("📊 Fetching player stats with advanced metrics...")
+    df = fetch_player_stats_with_advanced(session, season)
+    print(f"📈 Processing {len(df)} players...")
+    z_df = compute_advanced_z_scores(df)
     
-    # Per-36 score (for upside evaluation)
-    per36_z_cols = list(per36_stats.values())
-    z_df["per36_z_score"] = z_df[per36_z_cols].sum(axis=1)
+    if ENABLE_CACHING:
+        FEATURE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        z_df.to_parquet(cache_path, index=False, compression="zstd")
     
-    # Composite fantasy score (weighted combination)
-    z_df["composite_z_score"] = (
-        z_df["total_z_score"] * 0.6 +      # 60% traditional stats
-        z_df["advanced_z_score"] * 0.3 +   # 30% advanced efficiency
-        z_df["per36_z_score"] * 0.1        # 10% per-36 upside
-    )
+    return z_df
+
+def apply_age_adjustment(z_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add age_factor and age_adjusted_z_score for dynasty/keeper leagues.
     
-    # Add age-adjusted scores for dynasty/keeper leagues
-    if 'age' in qualified_df.columns:
-        age_data = qualified_df.set_index('player_id')['age']
-        z_df = z_df.set_index('player_id').join(age_data).reset_index()
-        
-        # Age adjustment factor (peak is around 27, decline after 30)
-        z_df['age_factor'] = z_df['age'].apply(lambda x: 
-            1.0 if pd.isna(x) else
-            1.1 if x <= 25 else
-            1.05 if x <= 27 else  
-            1.0 if x <= 29 else
-            0.95 if x <= 31 else
-            0.9 if x <= 33 else
-            0.85
-        )
+    Args:
+        z_df: DataFrame with composite_z_score and (optionally) age
         
-        z_df["age_adjusted_z_score"] = z_df["composite_z_score"] * z_df["age_factor"]
-    else:
+    Returns:
+        DataFrame with age-adjusted scores
+    """
+    if 'age' not in z_df.columns:
         z_df["age_adjusted_z_score"] = z_df["composite_z_score"]
+        return z_df
     
-    # Add timestamps
-    now = datetime.datetime.utcnow()
-    z_df["created_at"] = now
-    z_df["updated_at"] = now
+    # Age adjustment factor (peak is around 27, decline after 30)
+    ages = z_df['age'].to_numpy(dtype=np.float64)
+    nan_mask = np.isnan(ages)
+    idx = np.searchsorted(AGE_BREAKPOINTS, np.where(nan_mask, 0.0, ages), side='left')
+    factors = AGE_FACTORS[idx]
+    factors[nan_mask] = 1.0
+    z_df['age_factor'] = factors
     
-    print(f"✅ Computed enhanced z-scores for {len(z_df)} players")
+    z_df["age_adjusted_z_score"] = z_df["composite_z_score"].to_numpy() * factors
     return z_df
 
 def create_player_tiers(z_df: pd.DataFrame) -> pd.DataFrame:
@@ -208,91 +412,103 @@ def create_player_tiers(z_df: pd.DataFrame) -> pd.DataFrame:
     """
     z_df = z_df.copy()
     
-    # Define tier thresholds based on composite z-score
-    def assign_tier(score):
-        if score >= 8:
-            return "Elite (Tier 1)"
-        elif score >= 5:
-            return "Star (Tier 2)" 
-        elif score >= 2:
-            return "Solid (Tier 3)"
-        elif score >= 0:
-            return "Decent (Tier 4)"
-        elif score >= -2:
-            return "Streamer (Tier 5)"
-        else:
-            return "Waiver (Tier 6)"
-    
-    z_df["tier"] = z_df["composite_z_score"].apply(assign_tier)
+    # Bucket composite z-scores against the tier thresholds (NaN falls to Waiver)
+    scores = z_df["composite_z_score"].to_numpy(dtype=np.float64)
+    scores = np.where(np.isnan(scores), -np.inf, scores)
+    z_df["tier"] = TIER_LABELS[np.searchsorted(TIER_THRESHOLDS, scores, side="right")]
     
     # Add tier rankings within each tier
     z_df["tier_rank"] = z_df.groupby("tier")["composite_z_score"].rank(method="dense", ascending=False)
     
     return z_df
 
-def save_advanced_player_features(z_df: pd.DataFrame, session: Session):
+def save_advanced_player_features(z_df: pd.DataFrame, session: Session, commit: bool = True):
     """
     Save enhanced player features to database.
     
     Args:
         z_df: DataFrame with z-scores and features
         session: Database session
+        commit: Commit after saving; pass False to batch several seasons
+            into one transaction
     """
-    # Delete existing features for this season
     season = z_df["season"].iloc[0]
-    session.query(PlayerFeatures).filter(PlayerFeatures.season == season).delete()
-    
-    # Convert DataFrame to PlayerFeatures objects
-    features_list = []
-    for _, row in z_df.iterrows():
-        feature = PlayerFeatures(
-            player_id=int(row["player_id"]),
-            season=row["season"],
-            # Basic z-scores
-            z_points=float(row.get("z_points", 0)),
-            z_rebounds=float(row.get("z_rebounds", 0)),
-            z_assists=float(row.get("z_assists", 0)),
-            z_steals=float(row.get("z_steals", 0)),
-            z_blocks=float(row.get("z_blocks", 0)),
-            z_turnovers=float(row.get("z_turnovers", 0)),
-            z_fg_pct=float(row.get("z_fg_pct", 0)),
-            z_ft_pct=float(row.get("z_ft_pct", 0)),
-            z_three_pm=float(row.get("z_three_pm", 0)),
-            total_z_score=float(row.get("total_z_score", 0)),
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
-        features_list.append(feature)
-    
-    # Bulk insert
-    session.add_all(features_list)
-    session.commit()
-    
-    print(f"✅ Saved {len(features_list)} player features to database")
+    
+    # Coerce dtypes column-wise, then hand plain dicts to a single upsert
+    records_df = z_df.reindex(columns=FEATURE_COLUMNS)
+    records_df[FEATURE_Z_COLUMNS] = records_df[FEATURE_Z_COLUMNS].fillna(0).astype(float)
+    records_df["player_id"] = records_df["player_id"].astype("int64")
+    records = records_df.to_dict(orient="records")
+    
+    # Upsert on (player_id, season), backed by uq_player_features_player_season
+    stmt = pg_insert(PlayerFeatures).values(records)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["player_id", "season"],
+        set_={
+            **{c: stmt.excluded[c] for c in FEATURE_Z_COLUMNS},
+            "updated_at": func.timezone("utc", func.now()),
+        },
+    )
+    session.execute(stmt)
+    
+    # Drop players that no longer qualify for this season
+    session.query(PlayerFeatures).filter(
+        PlayerFeatures.season == season,
+        PlayerFeatures.player_id.notin_(records_df["player_id"].tolist())
+    ).delete(synchronize_session=False)
+    
+    if commit:
+        session.commit()
+    
+    print(f"✅ Saved {len(records)} player features to database")
 
-def generate_advanced_player_features(season: str = "2023-24"):
+def print_features_summary(z_df: pd.DataFrame, season: str):
+    """
+    Print tier distribution and top players for a season.
+    
+    Args:
+        z_df: DataFrame with tiers and composite scores
+        season: NBA season the features belong to
+    """
+    print(f"\n📊 Advanced Features Summary for {season}:")
+    print(f"Total Players: {len(z_df)}")
+    print(f"Tier Distribution:")
+    tier_counts = z_df["tier"].value_counts().sort_index()
+    for tier, count in tier_counts.items():
+        print(f"  {tier}: {count} players")
+    
+    print(f"\nTop 10 Players by Composite Z-Score:")
+    top_players = z_df.nlargest(10, "composite_z_score")[
+        ["player_id", "composite_z_score", "total_z_score", "advanced_z_score", "tier"]
+    ]
+    print(top_players.to_string(index=False))
+
+def generate_advanced_player_features(season: str = "2023-24", server_side: bool = False):
     """
     Main function to generate enhanced player features with advanced stats.
     
     Args:
         season: NBA season to process
+        server_side: Compute z-scores in Postgres instead of pandas
     """
     print(f"🚀 Generating advanced player features for {season}...")
     
     session = SessionLocal()
     try:
-        # Fetch player stats with advanced metrics
-        print("📊 Fetching player stats with advanced metrics...")
-        df = fetch_player_stats_with_advanced(session, season)
-        
-        if df.empty:
-            print(f"❌ No player stats found for {season}")
-            return
-        
-        print(f"📈 Processing {len(df)} players...")
-        
-        # Compute enhanced z-scores
-        z_df = compute_advanced_z_scores(df)
+        if server_side:
+            print("📊 Computing z-scores in the database...")
+            z_df = fetch_advanced_z_scores(session, season)
+            
+            if z_df.empty:
+                print(f"❌ No player stats found for {season}")
+                return
+        else:
+            # Compute enhanced z-scores (or reuse the snapshot for this stats version)
+            z_df = load_advanced_z_scores(session, season)
+            
+            if z_df.empty:
+                print(f"❌ No player stats found for {season}")
+                return
         
         # Create player tiers
         z_df = create_player_tiers(z_df)
@@ -300,19 +516,57 @@ def generate_advanced_player_features(season: str = "2023-24"):
         # Save to database
         save_advanced_player_features(z_df, session)
         
-        # Print summary
-        print(f"\n📊 Advanced Features Summary for {season}:")
-        print(f"Total Players: {len(z_df)}")
-        print(f"Tier Distribution:")
-        tier_counts = z_df["tier"].value_counts().sort_index()
-        for tier, count in tier_counts.items():
-            print(f"  {tier}: {count} players")
+        print_features_summary(z_df, season)
+        
+    except Exception as e:
+        session.rollback()
+        print(f"❌ Error generating advanced features: {e}")
+        raise
+    finally:
+        session.close()
+
+def generate_advanced_player_features_multi(seasons: List[str]):
+    """
+    Generate advanced player features for several seasons in one pass.
+    
+    Fetches every season with a single query and saves all of them in a
+    single transaction. Seasons that yield no z-scores are skipped. This
+    path always recomputes and does not use the parquet snapshots that
+    load_advanced_z_scores maintains.
+    
+    Args:
+        seasons: NBA seasons to process
+    """
+    print(f"🚀 Generating advanced player features for {len(seasons)} seasons...")
+    
+    session = SessionLocal()
+    try:
+        print("📊 Fetching player stats with advanced metrics...")
+        df = fetch_player_stats_multi(session, seasons)
+        
+        if df.empty:
+            print(f"❌ No player stats found for {', '.join(seasons)}")
+            return
+        
+        summaries = []
+        for season, season_df in df.groupby("season", sort=False):
+            print(f"📈 Processing {len(season_df)} players for {season}...")
+            z_df = compute_advanced_z_scores(season_df)
+            if z_df.empty:
+                print(f"❌ Z-score computation produced no rows for {season}")
+                continue
+            z_df = create_player_tiers(z_df)
+            save_advanced_player_features(z_df, session, commit=False)
+            summaries.append((season, z_df))
         
-        print(f"\nTop 10 Players by Composite Z-Score:")
-        top_players = z_df.nlargest(10, "composite_z_score")[
-            ["player_id", "composite_z_score", "total_z_score", "advanced_z_score", "tier"]
-        ]
-        print(top_players.to_string(index=False))
+        session.commit()
+        
+        for season, z_df in summaries:
+            print_features_summary(z_df, season)
+        
+        missing = set(seasons) - set(df["season"].unique())
+        for season in sorted(missing):
+            print(f"❌ No player stats found for {season}")
         
     except Exception as e:
         session.rollback()
@@ -327,16 +581,21 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate advanced player features")
     parser.add_argument("--season", default="2023-24", help="NBA season (e.g., 2023-24)")
     parser.add_argument("--all-seasons", action="store_true", help="Process all available seasons")
+    parser.add_argument("--server-side", action="store_true", help="Compute z-scores in the database")
     
     args = parser.parse_args()
     
     if args.all_seasons:
         seasons = ["2018-19", "2019-20", "2020-21", "2021-22", "2022-23", "2023-24"]
-        for season in seasons:
-            try:
-                generate_advanced_player_features(season)
-                print(f"✅ Completed {season}")
-            except Exception as e:
-                print(f"❌ Failed {season}: {e}")
+        if args.server_side:
+            for season in seasons:
+                try:
+                    generate_advanced_player_features(season, args.server_side)
+                    print(f"✅ Completed {season}")
+                except Exception as e:
+                    print(f"❌ Failed {season}: {e}")
+        else:
+            generate_advanced_player_features_multi(seasons)
+            print(f"✅ Completed {len(seasons)} seasons")
     else:
-        generate_advanced_player_features(args.season) 
\ No newline at end of file
+        generate_advanced_player_features(args.season, args.server_side)
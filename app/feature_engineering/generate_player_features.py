@@ -2,13 +2,13 @@
 Generate player features and z-scores from raw statistics.
 """
 
-import datetime
 import pandas as pd
 from scipy.stats import zscore
 from typing import Optional
+from sqlalchemy import select
 
 from app.models.models import PlayerStats, PlayerFeatures
-from app.utils.db import get_db, safe_commit, batch_upsert
+from app.utils.db import get_db, safe_commit
 from app.utils.validation import validate_season_format, validate_player_stats
 from app.utils.logging import setup_logger, log_execution_time
 from app.config.constants import PACE_FACTORS, FANTASY_SCORING
@@ -33,11 +33,10 @@ def fetch_player_stats(season: str) -> pd.DataFrame:
         raise ValueError(f"Invalid season format: {season}. Expected format: YYYY-YY")
         
     with get_db() as session:
-        players = session.query(PlayerStats).filter(PlayerStats.season == season).all()
-        data = [vars(p) for p in players]
-        df = pd.DataFrame(data).drop(columns=["_sa_instance_state"])
+        query = select(PlayerStats).where(PlayerStats.season == season)
+        df = pd.read_sql_query(query, session.connection())
         
-        logger.info(f"✅ Fetched {len(df)} player stats records for {season}")
+        logger.info("✅ Fetched %s player stats records for %s", len(df), season)
         return df
 
 def compute_z_scores(df: pd.DataFrame) -> pd.DataFrame:
@@ -80,12 +79,8 @@ def compute_z_scores(df: pd.DataFrame) -> pd.DataFrame:
 
     z_score_cols = list(stat_cols.values())
     z_df["total_z_score"] = z_df[z_score_cols].sum(axis=1)
-    
-    now = datetime.datetime.utcnow()
-    z_df["created_at"] = now
-    z_df["updated_at"] = now
 
-    logger.info(f"✅ Computed z-scores for {len(z_df)} players")
+    logger.info("✅ Computed z-scores for %s players", len(z_df))
     return z_df
 
 def insert_features(df: pd.DataFrame, batch_size: int = 100) -> bool:
@@ -99,13 +94,27 @@ def insert_features(df: pd.DataFrame, batch_size: int = 100) -> bool:
     Returns:
         bool: True if successful, False if failed
     """
-    records = [PlayerFeatures(**row.to_dict()) for _, row in df.iterrows()]
+    records = df.to_dict(orient="records")
+    seasons = df["season"].unique().tolist()
     
     with get_db() as session:
-        success = batch_upsert(session, PlayerFeatures, records, batch_size)
+        try:
+            # Replace the season(s) wholesale, then insert in executemany batches
+            session.query(PlayerFeatures).filter(
+                PlayerFeatures.season.in_(seasons)
+            ).delete(synchronize_session=False)
+            
+            for i in range(0, len(records), batch_size):
+                session.bulk_insert_mappings(PlayerFeatures, records[i:i + batch_size])
+        except Exception as e:
+            session.rollback()
+            logger.error("❌ Failed to insert features: %s", e)
+            return False
+        
+        success = safe_commit(session, "Failed to insert features")
         
         if success:
-            logger.info(f"✅ Inserted {len(records)} feature records")
+            logger.info("✅ Inserted %s feature records", len(records))
         else:
             logger.error("❌ Failed to insert features")
         
@@ -121,11 +130,11 @@ if __name__ == "__main__":
             import time
             start_time = time.time()
             
-            logger.info(f"📈 Processing {season}...")
+            logger.info("📈 Processing %s...", season)
             df_stats = fetch_player_stats(season)
             
             if df_stats.empty:
-                logger.warning(f"⚠️ Skipping {season} — no player stats found.")
+                logger.warning("⚠️ Skipping %s — no player stats found.", season)
                 continue
                 
             df_features = compute_z_scores(df_stats)
@@ -135,4 +144,4 @@ if __name__ == "__main__":
                 log_execution_time(logger, start_time, f"Processed {season}")
                 
         except Exception as e:
-            logger.error(f"❌ Failed to process {season}: {e}", exc_info=True)
+            logger.error("❌ Failed to process %s: %s", season, e, exc_info=True)
@@ -44,11 +44,11 @@ def load_adp_data() -> pd.DataFrame:
             result = valid_players[['player_id', 'clean_name', 'Rank']].copy()
             result.columns = ['player_id', 'name', 'adp']
             
-            logger.info(f"✅ Loaded ADP data for {len(result)} players")
+            logger.info("✅ Loaded ADP data for %s players", len(result))
             return result
             
     except Exception as e:
-        logger.error(f"❌ Failed to load ADP data: {e}", exc_info=True)
+        logger.error("❌ Failed to load ADP data: %s", e, exc_info=True)
         raise
 
 def load_actual_season_stats(season: str = "2023-24") -> pd.DataFrame:
@@ -102,15 +102,12 @@ def load_actual_season_stats(season: str = "2023-24") -> pd.DataFrame:
             stats_df['fg_pct'] * 10 + stats_df['ft_pct'] * 10
         )
 
-        # Apply pace and injury factors
-        def apply_adjustments(row):
-            pace = PACE_FACTORS.get(row['team'], 1.00)
-            injury = INJURY_RISK.get(row['name'], 1.00)
-            return row['fantasy_value'] * pace * injury
-
-        stats_df['adjusted_projection'] = stats_df.apply(apply_adjustments, axis=1)
+        # Apply pace and injury factors (vectorized lookups, 1.00 when unknown)
+        pace = stats_df['team'].map(PACE_FACTORS).fillna(1.00)
+        injury = stats_df['name'].map(INJURY_RISK).fillna(1.00)
+        stats_df['adjusted_projection'] = stats_df['fantasy_value'] * pace * injury
         
-        logger.info(f"✅ Loaded season stats for {len(stats_df)} players")
+        logger.info("✅ Loaded season stats for %s players", len(stats_df))
         return stats_df[['player_id', 'name', 'position', 'fantasy_value', 'adjusted_projection']]
 
 def simulate_draft(
@@ -181,7 +178,7 @@ def simulate_draft(
                     break
 
     drafted_team = pd.DataFrame(drafted)
-    logger.info(f"✅ Drafted {len(drafted_team)} players using {strategy} strategy")
+    logger.info("✅ Drafted %s players using %s strategy", len(drafted_team), strategy)
     return drafted_team
 
 def plot_results(adp_score: float, model_score: float, adjusted_score: float):
@@ -242,9 +239,9 @@ def main():
         model_score = model_team['fantasy_value'].sum()
         adjusted_score = adjusted_team['adjusted_projection'].sum()
 
-        logger.info(f"\n🏀 ADP Draft Total Fantasy Value: {adp_score:.2f}")
-        logger.info(f"🤖 Model Draft Total Fantasy Value: {model_score:.2f}")
-        logger.info(f"🚀 Adjusted Model Draft Total Fantasy Value: {adjusted_score:.2f}")
+        logger.info("\n🏀 ADP Draft Total Fantasy Value: %.2f", adp_score)
+        logger.info("🤖 Model Draft Total Fantasy Value: %.2f", model_score)
+        logger.info("🚀 Adjusted Model Draft Total Fantasy Value: %.2f", adjusted_score)
 
         logger.info("\n📊 Plotting results...")
         plot_results(adp_score, model_score, adjusted_score)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Boolean, UniqueConstraint, func
 from sqlalchemy.ext.declarative import declarative_base
 import datetime
 
@@ -22,6 +22,9 @@ class Player(Base):
 
 class PlayerStats(Base):
     __tablename__ = "player_stats"
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", name="uq_player_stats_player_season"),
+    )
 
     stats_id = Column(Integer, primary_key=True, index=True)
     player_id = Column(Integer)
@@ -120,6 +123,9 @@ class TeamSchedule(Base):
 
 class PlayerFeatures(Base):
     __tablename__ = "player_features"
+    __table_args__ = (
+        UniqueConstraint("player_id", "season", name="uq_player_features_player_season"),
+    )
 
     feature_id = Column(Integer, primary_key=True, index=True)
     player_id = Column(Integer, index=True)
@@ -136,8 +142,13 @@ class PlayerFeatures(Base):
     z_three_pm = Column(Float)
     total_z_score = Column(Float)
 
-    created_at = Column(DateTime, default=datetime.datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    # Filled in by Postgres so bulk inserts don't ship a timestamp per row
+    created_at = Column(DateTime, server_default=func.timezone("utc", func.now()))
+    updated_at = Column(
+        DateTime,
+        server_default=func.timezone("utc", func.now()),
+        onupdate=func.timezone("utc", func.now()),
+    )
 
 class PlayerSeasonInfo(Base):
     __tablename__ = "player_season_info"
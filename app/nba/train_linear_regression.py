@@ -4,19 +4,13 @@ import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
 
 # Add project root to path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
-# Load environment variables
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-# Connect to Supabase
-engine = create_engine(DATABASE_URL)
+# Reuse the shared engine/connection pool (Supabase)
+from app.db.connection import engine
 
 def fetch_training_data():
     query = """
@@ -1,8 +1,8 @@
 import sys
 import os
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 # Set up project path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
@@ -99,6 +99,31 @@ async def get_all_sparklines(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating sparklines: {str(e)}")
 
+@router.post("/players/sparklines")
+async def get_sparklines_for_players(
+    player_ids: List[int] = Body(..., embed=True, max_length=100, description="Player IDs to fetch (at most 100)"),
+    seasons_back: int = Body(default=3, ge=1, le=10, embed=True, description="Number of seasons to analyze"),
+    db: Session = Depends(get_db)
+) -> Dict[int, Dict[str, Dict[str, Any]]]:
+    """
+    Get sparkline data for all key stats for several players in one request.
+    
+    Args:
+        player_ids: The players' IDs (at most 100)
+        seasons_back: Number of seasons to include (1-10, default 3)
+        db: Database session
+        
+    Returns:
+        Dictionary mapping player_id to {stat name: sparkline data}
+    """
+    service = HistoricalStatsService(db)
+    
+    try:
+        return service.get_sparklines_for_players(player_ids, seasons_back)
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error generating sparklines: {str(e)}")
+
 @router.get("/player/{player_id}/historical-stats")
 async def get_historical_stats(
     player_id: int,
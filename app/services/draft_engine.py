@@ -2,17 +2,13 @@ from typing import List, Dict
 import os
 import sys
 import pandas as pd
-from sqlalchemy import create_engine
-from dotenv import load_dotenv
 
 # Setup project path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 sys.path.insert(0, project_root)
 
-# Load environment variables
-load_dotenv()
-DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
+# Reuse the shared engine/connection pool
+from app.db.connection import engine
 
 # Load player data
 def fetch_player_pool(season: str = "2023-24") -> List[Dict]:
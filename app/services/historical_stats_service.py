@@ -51,24 +51,75 @@ class HistoricalStatsService:
         )
         
         return [
-            {
-                'season': stat.season,
-                'games_played': stat.games_played,
-                'minutes_per_game': stat.minutes_per_game,
-                'points_per_game': stat.points_per_game,
-                'rebounds_per_game': stat.rebounds_per_game,
-                'assists_per_game': stat.assists_per_game,
-                'steals_per_game': stat.steals_per_game,
-                'blocks_per_game': stat.blocks_per_game,
-                'turnovers_per_game': stat.turnovers_per_game,
-                'fg_pct': stat.fg_pct,
-                'ft_pct': stat.ft_pct,
-                'three_pm': stat.three_pm,
-                'team': stat.team
-            }
+            self._season_stats_to_dict(stat)
             for stat in reversed(historical_stats)  # Reverse to get chronological order
         ]
     
+    def get_sparklines_for_players(self, player_ids: List[int], seasons_back: int = 3) -> Dict[int, Dict[str, Dict[str, Any]]]:
+        """
+        Generate sparkline data for all key stats for several players at once.
+        
+        Loads every requested player's stats with a single query instead of
+        one query per player and stat.
+        
+        Args:
+            player_ids: The players' IDs
+            seasons_back: Number of seasons to include
+            
+        Returns:
+            Dictionary mapping player_id to {stat name: sparkline data}
+        """
+        rows = (
+            self.db.query(PlayerStats)
+            .filter(PlayerStats.player_id.in_(player_ids))
+            .order_by(PlayerStats.player_id, desc(PlayerStats.season))
+            .all()
+        )
+        
+        # Most recent seasons first per player, capped at seasons_back
+        recent_by_player: Dict[int, List[PlayerStats]] = {player_id: [] for player_id in player_ids}
+        for stat in rows:
+            recent = recent_by_player[stat.player_id]
+            if len(recent) < seasons_back:
+                recent.append(stat)
+        
+        sparklines = {}
+        for player_id, recent in recent_by_player.items():
+            historical_data = [self._season_stats_to_dict(stat) for stat in reversed(recent)]
+            sparklines[player_id] = {
+                stat_name: self._build_sparkline(stat_name, historical_data)
+                for stat_name in self.KEY_STATS
+            }
+        
+        return sparklines
+    
+    @staticmethod
+    def _season_stats_to_dict(stat: PlayerStats) -> Dict[str, Any]:
+        """
+        Convert a PlayerStats row into the season dict used for sparklines.
+        
+        Args:
+            stat: PlayerStats row
+            
+        Returns:
+            Dictionary of the season's key stats
+        """
+        return {
+            'season': stat.season,
+            'games_played': stat.games_played,
+            'minutes_per_game': stat.minutes_per_game,
+            'points_per_game': stat.points_per_game,
+            'rebounds_per_game': stat.rebounds_per_game,
+            'assists_per_game': stat.assists_per_game,
+            'steals_per_game': stat.steals_per_game,
+            'blocks_per_game': stat.blocks_per_game,
+            'turnovers_per_game': stat.turnovers_per_game,
+            'fg_pct': stat.fg_pct,
+            'ft_pct': stat.ft_pct,
+            'three_pm': stat.three_pm,
+            'team': stat.team
+        }
+    
     def generate_sparkline_data(self, player_id: int, stat_name: str, seasons_back: int = 3) -> Dict[str, Any]:
         """
         Generate sparkline data for a specific stat across seasons.
@@ -85,7 +136,19 @@ class HistoricalStatsService:
             raise ValueError(f"Stat '{stat_name}' not supported. Must be one of: {self.KEY_STATS}")
         
         historical_data = self.get_player_historical_stats(player_id, seasons_back)
+        return self._build_sparkline(stat_name, historical_data)
+    
+    def _build_sparkline(self, stat_name: str, historical_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build sparkline data for one stat from a player's season dicts.
         
+        Args:
+            stat_name: Name of the stat (e.g., 'points_per_game')
+            historical_data: Season dicts in chronological order
+            
+        Returns:
+            Dictionary with sparkline data and metadata
+        """
         if not historical_data:
             return {
                 'stat_name': stat_name,
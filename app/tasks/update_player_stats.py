@@ -29,7 +29,7 @@ def fetch_current_stats() -> List[Dict]:
         if not validate_season_format(CURRENT_SEASON):
             raise ValueError(f"Invalid season format in settings: {CURRENT_SEASON}")
             
-        logger.info(f"📊 Fetching current season stats for {CURRENT_SEASON}")
+        logger.info("📊 Fetching current season stats for %s", CURRENT_SEASON)
         
         response = make_nba_request(
             endpoint="leaguedashplayerstats",
@@ -67,11 +67,11 @@ def fetch_current_stats() -> List[Dict]:
                 'updated_at': datetime.utcnow()
             })
             
-        logger.info(f"✅ Successfully fetched stats for {len(stats)} players")
+        logger.info("✅ Successfully fetched stats for %s players", len(stats))
         return stats
         
     except Exception as e:
-        logger.error(f"❌ Failed to fetch current stats: {e}", exc_info=True)
+        logger.error("❌ Failed to fetch current stats: %s", e, exc_info=True)
         raise
 
 def update_player_stats(stats: List[Dict]) -> None:
@@ -85,7 +85,7 @@ def update_player_stats(stats: List[Dict]) -> None:
         Exception: If database update fails
     """
     try:
-        logger.info(f"💾 Updating stats for {len(stats)} players")
+        logger.info("💾 Updating stats for %s players", len(stats))
         
         # Validate stats before processing
         stats_df = pd.DataFrame(stats)
@@ -117,10 +117,10 @@ def update_player_stats(stats: List[Dict]) -> None:
                 unique_fields=['player_id', 'season']
             )
             
-            logger.info(f"✅ Successfully updated stats for {len(valid_stats)} players")
+            logger.info("✅ Successfully updated stats for %s players", len(valid_stats))
             
     except Exception as e:
-        logger.error(f"❌ Failed to update player stats: {e}", exc_info=True)
+        logger.error("❌ Failed to update player stats: %s", e, exc_info=True)
         raise
 
 def main():
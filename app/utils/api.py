@@ -4,12 +4,24 @@ NBA API utility functions and helpers.
 
 import random
 import time
+import asyncio
+import aiohttp
 import requests
+import requests_cache
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 
 from app.config.constants import NBA_API_CONFIG
+from app.config.settings import PROJECT_ROOT, ENABLE_CACHING
+
+# On-disk HTTP cache for NBA API responses (SQLite file at the project root)
+NBA_CACHE_NAME = str(PROJECT_ROOT / "nba_cache")
+NBA_CACHE_EXPIRE_AFTER = 24 * 60 * 60  # 1 day
+NBA_CACHE_URLS_EXPIRE_AFTER = {
+    # Season totals barely move mid-season, keep them for a week
+    "stats.nba.com/stats/leaguedashplayerstats": 7 * 24 * 60 * 60,
+}
 
 # NBA API headers with randomized user agents
 USER_AGENTS = [
@@ -33,22 +45,56 @@ def create_nba_session() -> requests.Session:
     """
     Create a requests Session with retry strategy for NBA API calls.
     
+    When caching is enabled the session is a requests_cache.CachedSession,
+    so repeated GETs for the same URL + params are served from disk.
+    
     Returns:
         requests.Session: Configured session object
     """
     retry_strategy = Retry(
         total=3,  # number of retries
-        backoff_factor=0.5,  # time between retries
+        backoff_factor=2,  # time between retries (stats.nba.com throttles hard)
         status_forcelist=[429, 500, 502, 503, 504],
     )
     
-    session = requests.Session()
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    if ENABLE_CACHING:
+        session = requests_cache.CachedSession(
+            NBA_CACHE_NAME,
+            backend="sqlite",
+            expire_after=NBA_CACHE_EXPIRE_AFTER,
+            urls_expire_after=NBA_CACHE_URLS_EXPIRE_AFTER,
+            allowable_codes=(200,),
+            allowable_methods=("GET",),
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=retry_strategy
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     
+    # Static headers are set once; only the User-Agent rotates per request
+    session.headers.update(NBA_API_CONFIG["HEADERS"])
+    
     return session
 
+# Shared session so the on-disk cache and connection pool persist across calls
+nba_session = create_nba_session()
+
+def clear_session() -> None:
+    """
+    Drop the shared NBA session and its connection pool and start a fresh one.
+    
+    Called after timeouts/connection errors, which can leave pooled
+    connections to stats.nba.com in a bad state.
+    """
+    global nba_session
+    nba_session.close()
+    nba_session = create_nba_session()
+
 def make_nba_request(
     endpoint: str,
     params: Optional[Dict[str, Any]] = None,
@@ -69,26 +115,78 @@ def make_nba_request(
         requests.exceptions.RequestException: If request fails
     """
     url = f"{NBA_API_CONFIG['BASE_URL']}/{endpoint}"
-    session = create_nba_session()
     
     try:
-        response = session.get(
+        response = nba_session.get(
             url,
-            headers=get_nba_headers(),
+            headers={"User-Agent": random.choice(USER_AGENTS)},
             params=params or {},
             timeout=timeout
         )
         response.raise_for_status()
         
-        # Random delay between requests (0.5-1.5 seconds)
-        time.sleep(0.5 + random.random())
+        # Random delay between requests (0.5-1.5 seconds), skipped for cache hits
+        if not getattr(response, "from_cache", False):
+            time.sleep(0.5 + random.random())
         
         return response.json()
         
+    except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+        print(f"❌ NBA API connection failed, resetting session: {e}")
+        clear_session()
+        raise
     except requests.exceptions.RequestException as e:
         print(f"❌ NBA API request failed: {e}")
         if hasattr(e.response, 'text'):
             print(f"Response content: {e.response.text}")
         raise
-    finally:
-        session.close() 
\ No newline at end of file
+
+def create_nba_client_session() -> aiohttp.ClientSession:
+    """
+    Create an aiohttp ClientSession for concurrent NBA API calls.
+    
+    Headers are set once on the session so every request reuses them
+    along with the pooled TCP/TLS connections.
+    
+    Returns:
+        aiohttp.ClientSession: Configured async session (caller must close it)
+    """
+    return aiohttp.ClientSession(
+        headers=get_nba_headers(),
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+async def make_nba_request_async(
+    session: aiohttp.ClientSession,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Async counterpart of make_nba_request using a shared aiohttp session.
+    
+    Args:
+        session (aiohttp.ClientSession): Session from create_nba_client_session()
+        endpoint (str): API endpoint (e.g., 'leaguedashplayerstats')
+        params (Dict[str, Any], optional): Query parameters
+        
+    Returns:
+        Dict[str, Any]: JSON response data
+        
+    Raises:
+        aiohttp.ClientError: If request fails
+    """
+    url = f"{NBA_API_CONFIG['BASE_URL']}/{endpoint}"
+    
+    try:
+        async with session.get(url, params=params or {}) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+        
+        # Random delay between requests (0.5-1.5 seconds)
+        await asyncio.sleep(0.5 + random.random())
+        
+        return data
+        
+    except aiohttp.ClientError as e:
+        print(f"❌ NBA API request failed: {e}")
+        raise
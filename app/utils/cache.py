@@ -0,0 +1,175 @@
+"""
+Redis-backed memoization for expensive NBA API fetches.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from typing import Any, Callable, Optional
+
+import pandas as pd
+import pyarrow as pa
+import redis
+
+from app.config.settings import REDIS_URL, CACHE_TTL, ENABLE_CACHING
+from app.utils.logging import setup_logger
+
+# Set up logger
+logger = setup_logger(__name__)
+
+# Keep an unreachable Redis from stalling callers for the OS connect timeout
+REDIS_SOCKET_TIMEOUT = 0.5
+
+# After a connection failure, skip Redis entirely for this many seconds
+REDIS_RETRY_INTERVAL = 60
+
+_client: Optional[redis.Redis] = None
+_unavailable_until = 0.0
+
+def get_redis_client() -> redis.Redis:
+    """
+    Get the shared Redis client, creating it on first use.
+    
+    Returns:
+        redis.Redis: Client connected to REDIS_URL
+    """
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+    return _client
+
+def _redis_available() -> bool:
+    """Whether Redis should be tried, i.e. it hasn't failed to connect recently."""
+    return time.monotonic() >= _unavailable_until
+
+def _handle_redis_error(action: str, cache_key: str, error: redis.RedisError):
+    """
+    Log a Redis failure; connection failures also disable Redis for a while.
+    
+    The warning for an unreachable server is logged once per outage rather
+    than on every call.
+    
+    Args:
+        action (str): "read" or "write", for the log message
+        cache_key (str): Redis key involved
+        error (redis.RedisError): The failure
+    """
+    global _unavailable_until
+    if isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+        if _redis_available():
+            logger.warning("⚠️ Redis unavailable, caching disabled for %ss: %s",
+                           REDIS_RETRY_INTERVAL, error)
+        _unavailable_until = time.monotonic() + REDIS_RETRY_INTERVAL
+    else:
+        logger.warning("⚠️ Redis %s failed for %s: %s", action, cache_key, error)
+
+def serialize_frame(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to Arrow IPC bytes."""
+    return pa.ipc.serialize_pandas(df).to_pybytes()
+
+def deserialize_frame(data: bytes) -> pd.DataFrame:
+    """Load a DataFrame from Arrow IPC bytes."""
+    return pa.ipc.deserialize_pandas(data)
+
+def _cache_read(cache_key: str, deserialize: Callable[[bytes], Any]) -> Any:
+    """
+    Read a cached value, treating Redis errors as a miss.
+    
+    Args:
+        cache_key (str): Redis key
+        deserialize (Callable): bytes -> result
+        
+    Returns:
+        Any: Cached result, or None on a miss
+    """
+    if not _redis_available():
+        return None
+    try:
+        cached = get_redis_client().get(cache_key)
+        if cached is not None:
+            return deserialize(cached)
+    except redis.RedisError as e:
+        _handle_redis_error("read", cache_key, e)
+    return None
+
+def _cache_write(cache_key: str, result: Any, ttl: int, serialize: Callable[[Any], bytes],
+                 should_cache: Callable[[Any], bool]):
+    """
+    Store a fresh result if should_cache allows it, ignoring Redis errors.
+    
+    Args:
+        cache_key (str): Redis key
+        result (Any): Fresh result of the wrapped call
+        ttl (int): Expiry in seconds
+        serialize (Callable): Result -> bytes
+        should_cache (Callable): Whether the result may be stored
+    """
+    if not _redis_available() or not should_cache(result):
+        return
+    try:
+        get_redis_client().setex(cache_key, ttl, serialize(result))
+    except redis.RedisError as e:
+        _handle_redis_error("write", cache_key, e)
+
+def redis_cache(
+    key: Callable[..., str],
+    ttl: int = CACHE_TTL,
+    serialize: Callable[[Any], bytes] = serialize_frame,
+    deserialize: Callable[[bytes], Any] = deserialize_frame,
+    should_cache: Callable[[Any], bool] = lambda result: result is not None
+):
+    """
+    Memoize a function's result in Redis.
+    
+    Redis errors never break the wrapped call: on any failure the
+    function simply runs uncached. Coroutine functions are supported
+    too, with the same key and should_cache rules; their Redis calls run
+    in a worker thread so they never block the event loop.
+    
+    Args:
+        key (Callable[..., str]): Builds the cache key from the call arguments
+        ttl (int): Expiry in seconds
+        serialize (Callable): Result -> bytes (defaults to Arrow IPC for DataFrames)
+        deserialize (Callable): bytes -> result
+        should_cache (Callable): Whether a fresh result may be stored
+        
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not ENABLE_CACHING:
+                    return await func(*args, **kwargs)
+                
+                cache_key = key(*args, **kwargs)
+                cached = await asyncio.to_thread(_cache_read, cache_key, deserialize)
+                if cached is not None:
+                    return cached
+                
+                result = await func(*args, **kwargs)
+                await asyncio.to_thread(_cache_write, cache_key, result, ttl, serialize, should_cache)
+                return result
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLE_CACHING:
+                return func(*args, **kwargs)
+            
+            cache_key = key(*args, **kwargs)
+            cached = _cache_read(cache_key, deserialize)
+            if cached is not None:
+                return cached
+            
+            result = func(*args, **kwargs)
+            _cache_write(cache_key, result, ttl, serialize, should_cache)
+            return result
+        return wrapper
+    return decorator
@@ -2,6 +2,12 @@
 Utility functions for data cleaning and preprocessing.
 """
 
+import re
+import pandas as pd
+
+# "Last, First" -> groups (last, first)
+_LAST_FIRST_RE = re.compile(r"^(.*?), (.*)$")
+
 def clean_player_name(name: str) -> str:
     """
     Standardize player name format.
@@ -17,6 +23,18 @@ def clean_player_name(name: str) -> str:
         return f"{first} {last}".strip()
     return name.strip()
 
+def clean_player_names(names: pd.Series) -> pd.Series:
+    """
+    Vectorized clean_player_name over a Series of names.
+    
+    Args:
+        names (pd.Series): Raw player names
+        
+    Returns:
+        pd.Series: Cleaned player names
+    """
+    return names.str.replace(_LAST_FIRST_RE, r"\2 \1", regex=True).str.strip()
+
 def map_position(position: str) -> str:
     """
     Standardize position mapping.
@@ -3,7 +3,9 @@ Database utility functions and context managers.
 """
 
 from contextlib import contextmanager
+from io import StringIO
 from typing import Generator
+import pandas as pd
 from sqlalchemy.orm import Session
 from app.db.connection import SessionLocal
 
@@ -76,4 +78,29 @@ def batch_upsert(session: Session, model, records: list, batch_size: int = 100)
     except Exception as e:
         session.rollback()
         print(f"❌ Batch operation failed: {e}")
-        return False 
\ No newline at end of file
+        return False
+
+def copy_dataframe(session: Session, table_name: str, df: pd.DataFrame) -> int:
+    """
+    Bulk-load a DataFrame into a table with Postgres COPY FROM STDIN.
+    
+    Columns are matched by name, so df must only contain columns that
+    exist on the target table. Runs inside the session's transaction.
+    
+    Args:
+        session (Session): SQLAlchemy session (psycopg 3 driver)
+        table_name (str): Target table
+        df (pd.DataFrame): Rows to load
+        
+    Returns:
+        int: Number of rows copied
+    """
+    buf = StringIO()
+    df.to_csv(buf, index=False, header=False)
+    
+    columns = ", ".join(df.columns)
+    cursor = session.connection().connection.cursor()
+    with cursor.copy(f"COPY {table_name} ({columns}) FROM STDIN WITH CSV") as copy:
+        copy.write(buf.getvalue())
+    
+    return len(df)
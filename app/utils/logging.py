@@ -63,7 +63,7 @@ def log_execution_time(logger: logging.Logger, start_time: float, operation: str
     """
     import time
     duration = time.time() - start_time
-    logger.info(f"✨ {operation} completed in {duration:.2f} seconds")
+    logger.info("✨ %s completed in %.2f seconds", operation, duration)
 
 def log_error_with_context(
     logger: logging.Logger,
@@ -80,6 +80,10 @@ def log_error_with_context(
         context (dict): Additional context information
         level (int): Logging level for this error
     """
+    # Skip building the context string when this level is filtered out
+    if not logger.isEnabledFor(level):
+        return
+    
     error_type = type(error).__name__
     error_msg = str(error)
     
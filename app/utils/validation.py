@@ -6,6 +6,8 @@ from typing import Union, List, Dict, Any
 import pandas as pd
 import numpy as np
 
+from app.config.constants import SUPPORTED_SEASONS_SET
+
 def validate_season_format(season: str) -> bool:
     """
     Validate season string format (e.g., '2023-24').
@@ -19,6 +21,10 @@ def validate_season_format(season: str) -> bool:
     try:
         if not isinstance(season, str):
             return False
+        
+        # Fast path: every supported season is already known to be well-formed
+        if season in SUPPORTED_SEASONS_SET:
+            return True
             
         if len(season) != 7:  # YYYY-YY format
             return False
@@ -3,18 +3,78 @@ The Lineup - Draft Historical Trends Integration
 Streamlit component for displaying historical trends within the draft assistant
 """
 
+import html
+from collections import Counter
 import pandas as pd
 import streamlit as st
-import plotly.graph_objects as go
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import requests
-from streamlit_extras.colored_header import colored_header
+from requests.adapters import HTTPAdapter
+
+# Quick trend indicators: players fetched per call
+QUICK_TREND_MAX_PLAYERS = 10
+
+# Trend direction -> sparkline color / indicator emoji
+TREND_COLORS = {
+    'increasing': '#28a745',
+    'decreasing': '#dc3545',
+    'stable': '#6c757d',
+    'volatile': '#fd7e14'
+}
+TREND_EMOJIS = {
+    'increasing': '📈',
+    'decreasing': '📉',
+    'stable': '➡️',
+    'volatile': '📊'
+}
+
+# Inner padding (px) so sparkline markers aren't clipped at the edges
+SPARKLINE_PADDING = 3
+
+# Stats shown in the trends tab grids (stat key -> display name)
+KEY_TREND_STATS = {
+    'points_per_game': 'Points',
+    'rebounds_per_game': 'Rebounds',
+    'assists_per_game': 'Assists',
+    'steals_per_game': 'Steals',
+    'blocks_per_game': 'Blocks'
+}
+EFFICIENCY_TREND_STATS = {
+    'fg_pct': 'FG%',
+    'ft_pct': 'FT%',
+    'three_pm': '3PM'
+}
+PERCENTAGE_TREND_STATS = frozenset({'fg_pct', 'ft_pct'})
+
+# Draft insights from trend counts. Each group is a list of
+# (minimum counts, message) alternatives; the first match in a group wins.
+TREND_INSIGHT_RULES = (
+    (
+        ({'increasing': 3}, "🔥 **Rising Star**: Multiple stats trending upward - could be a breakout candidate"),
+        ({'decreasing': 3}, "⚠️ **Declining Performance**: Multiple stats trending downward - consider carefully"),
+    ),
+    (
+        ({'volatile': 2}, "📊 **High Volatility**: Inconsistent performance - higher risk/reward player"),
+    ),
+    (
+        ({'stable': 3}, "🎯 **Consistent Performer**: Stable production - reliable floor"),
+    ),
+)
+SCORING_UPTREND_INSIGHT = "📈 **Scoring Uptrend**: Points per game improving - offensive development"
+MIXED_TRENDS_INSIGHT = "📊 **Mixed Trends**: Performance varies by category - analyze specific needs"
+
+# Session state keys that must all be set before the trends analysis renders
+TRENDS_SESSION_KEYS = frozenset({'trends_player_id', 'trends_player_name', 'trends_player_info'})
 
 
 def create_compact_sparkline(values: List[float], seasons: List[str], stat_name: str, 
-                           trend: str = 'stable', width: int = 150, height: int = 40) -> go.Figure:
+                           trend: str = 'stable', width: int = 150, height: int = 40) -> str:
     """
-    Create a compact sparkline for the draft assistant.
+    Create a compact sparkline for the draft assistant as inline SVG.
+    
+    A sparkline here is 2-3 points, so a hand-built <polyline> replaces a
+    full Plotly figure (and its plotly.js bootstrap) per chart. Each point
+    carries a <title> so hovering still shows the season and value.
     
     Args:
         values: List of stat values across seasons
@@ -25,70 +85,76 @@ def create_compact_sparkline(values: List[float], seasons: List[str], stat_name:
         height: Chart height in pixels
         
     Returns:
-        Plotly figure object
+        SVG markup for st.markdown(..., unsafe_allow_html=True)
     """
     if not values or len(values) < 2:
         # Create empty sparkline
-        fig = go.Figure()
-        fig.add_annotation(
-            text="No data",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5,
-            showarrow=False,
-            font=dict(size=8, color="gray")
-        )
-        fig.update_layout(
-            width=width, height=height,
-            margin=dict(l=0, r=0, t=0, b=0),
-            showlegend=False,
-            xaxis=dict(visible=False),
-            yaxis=dict(visible=False),
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+        return (
+            f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">'
+            f'<text x="50%" y="50%" dominant-baseline="middle" text-anchor="middle" '
+            f'font-size="8" fill="gray">No data</text></svg>'
         )
-        return fig
-    
-    # Color mapping for trends
-    trend_colors = {
-        'increasing': '#28a745',
-        'decreasing': '#dc3545',
-        'stable': '#6c757d',
-        'volatile': '#fd7e14'
-    }
     
-    color = trend_colors.get(trend, '#6c757d')
-    
-    # Create the sparkline
-    fig = go.Figure()
-    
-    # Add the line
-    fig.add_trace(go.Scatter(
-        x=list(range(len(values))),
-        y=values,
-        mode='lines+markers',
-        line=dict(color=color, width=1.5),
-        marker=dict(size=3, color=color),
-        hovertemplate=f'<b>{stat_name}</b><br>' +
-                     'Season: %{customdata}<br>' +
-                     'Value: %{y:.1f}<extra></extra>',
-        customdata=seasons,
-        showlegend=False
-    ))
-    
-    # Update layout for compact sparkline
-    fig.update_layout(
-        width=width,
-        height=height,
-        margin=dict(l=2, r=2, t=2, b=2),
-        showlegend=False,
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        hovermode='closest'
+    color = TREND_COLORS.get(trend, '#6c757d')
+    
+    # Scale points into the box, leaving room for the markers at the edges
+    pad = SPARKLINE_PADDING
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    x_step = (width - 2 * pad) / (len(values) - 1)
+    points = [
+        (pad + i * x_step, height - pad - (value - low) / span * (height - 2 * pad))
+        for i, value in enumerate(values)
+    ]
+    
+    polyline = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+    markers = "".join(
+        f'<circle cx="{x:.1f}" cy="{y:.1f}" r="1.5" fill="{color}">'
+        f'<title>{html.escape(stat_name)} | Season: {html.escape(str(season))} | Value: {value:.1f}</title>'
+        f'</circle>'
+        for (x, y), season, value in zip(points, seasons, values)
     )
     
-    return fig
+    return (
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">'
+        f'<polyline points="{polyline}" fill="none" stroke="{color}" stroke-width="1.5"/>'
+        f'{markers}</svg>'
+    )
+
+
+@st.cache_resource
+def get_api_session() -> requests.Session:
+    """
+    Get a shared HTTP session for the trends API with keep-alive pooling.
+    
+    Returns:
+        requests Session reused across reruns and users
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=1)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_player_trends(player_id: int, api_base_url: str) -> Dict[str, Any]:
+    """
+    Fetch a player's trend data from the API.
+    
+    Cached for 5 minutes per player. Failed requests raise and are therefore
+    not cached.
+    
+    Args:
+        player_id: The player's ID
+        api_base_url: Base URL for the API
+        
+    Returns:
+        Parsed JSON response
+    """
+    response = get_api_session().get(f"{api_base_url}/api/historical/player/{player_id}/trends?seasons_back=3", timeout=3)
+    response.raise_for_status()
+    return response.json()
 
 
 def render_player_trend_summary(player_id: int, player_name: str, 
@@ -105,12 +171,7 @@ def render_player_trend_summary(player_id: int, player_name: str,
         Trend data if successful, None otherwise
     """
     try:
-        response = requests.get(f"{api_base_url}/api/historical/player/{player_id}/trends?seasons_back=3", timeout=3)
-        
-        if response.status_code != 200:
-            return None
-        
-        data = response.json()
+        data = _fetch_player_trends(player_id, api_base_url)
         sparklines = data.get('sparklines', {})
         seasons_analyzed = data.get('seasons_analyzed', 0)
         
@@ -118,14 +179,9 @@ def render_player_trend_summary(player_id: int, player_name: str,
             return None
         
         # Count trends for quick assessment
-        trend_counts = {'increasing': 0, 'decreasing': 0, 'stable': 0, 'volatile': 0}
         key_stats = ['points_per_game', 'rebounds_per_game', 'assists_per_game', 'steals_per_game', 'blocks_per_game']
-        
-        for stat in key_stats:
-            if stat in sparklines:
-                trend = sparklines[stat].get('trend', 'stable')
-                if trend in trend_counts:
-                    trend_counts[trend] += 1
+        counts = Counter(sparklines[stat].get('trend', 'stable') for stat in key_stats if stat in sparklines)
+        trend_counts = {trend: counts[trend] for trend in ('increasing', 'decreasing', 'stable', 'volatile')}
         
         return {
             'sparklines': sparklines,
@@ -139,6 +195,89 @@ def render_player_trend_summary(player_id: int, player_name: str,
         return None
 
 
+# Ids change after every pick in every session, so cap the shared cache
+@st.cache_data(max_entries=32, show_spinner=False)
+def _build_player_options(ids: Tuple[int, ...], names: Tuple[str, ...]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Build the player selectbox labels and a label -> player_id lookup.
+    
+    Keyed only on the id/name tuples, so reruns neither copy nor hash the
+    rest of the player frame.
+    
+    Args:
+        ids: Player IDs in display order
+        names: Player names aligned with ids
+        
+    Returns:
+        Tuple of (selectbox labels, label -> player_id)
+    """
+    display_options = [f"{name} (ID: {pid})" for pid, name in zip(ids, names)]
+    return display_options, dict(zip(display_options, ids))
+
+
+def _player_info_map(available_players_df: pd.DataFrame) -> Dict[int, Dict[str, Any]]:
+    """
+    Map player_id to that player's row as a plain dict.
+    
+    Not cached: the same ids can come from another season or a refreshed
+    pool, and the caller only passes a few rows.
+    
+    Args:
+        available_players_df: DataFrame of available players
+        
+    Returns:
+        Dictionary of player_id -> row dict (first row per player)
+    """
+    info_by_id = {}
+    for record in available_players_df.to_dict('records'):
+        info_by_id.setdefault(record['player_id'], record)
+    return info_by_id
+
+
+def _render_stat_grid(stat_names: Dict[str, str], sparklines: Dict[str, Any],
+                      pct_keys: frozenset = frozenset()) -> None:
+    """
+    Render a 3-column grid of stat sparklines with their latest values.
+    
+    Args:
+        stat_names: Stat key -> display name, in grid order
+        sparklines: Sparkline data keyed by stat name
+        pct_keys: Stats shown as a percentage (without a delta)
+    """
+    # Create 3 columns for sparklines
+    cols = st.columns(3)
+    
+    for i, (stat_key, stat_display) in enumerate(stat_names.items()):
+        if stat_key not in sparklines:
+            continue
+        
+        sparkline_data = sparklines[stat_key]
+        values = sparkline_data.get('values', [])
+        seasons = sparkline_data.get('seasons', [])
+        trend = sparkline_data.get('trend', 'stable')
+        latest_value = sparkline_data.get('latest_value')
+        change_from_previous = sparkline_data.get('change_from_previous')
+        
+        with cols[i % 3]:
+            st.markdown(f"**{TREND_EMOJIS.get(trend, '📊')} {stat_display}**")
+            
+            if not values:
+                st.markdown("*No data*")
+                continue
+            
+            # Create compact sparkline
+            sparkline = create_compact_sparkline(values, seasons, stat_display, trend)
+            st.markdown(sparkline, unsafe_allow_html=True)
+            
+            # Show current value and change
+            if latest_value is not None:
+                if stat_key in pct_keys:
+                    st.metric("", f"{latest_value:.1%}")
+                else:
+                    delta_str = f"{change_from_previous:+.1f}" if change_from_previous is not None else None
+                    st.metric("", f"{latest_value:.1f}", delta=delta_str)
+
+
 def render_draft_historical_trends_tab(available_players_df: pd.DataFrame, 
                                      api_base_url: str = "http://localhost:8000") -> None:
     """
@@ -154,14 +293,18 @@ def render_draft_historical_trends_tab(available_players_df: pd.DataFrame,
     # Player selection
     col_select, col_info = st.columns([2, 1])
     
+    # O(1) lookups from the selectbox label back to the player row
+    player_ids = tuple(available_players_df['player_id'].tolist())
+    display_options, display_to_id = _build_player_options(
+        player_ids, tuple(available_players_df['name'].tolist())
+    )
+    info_by_id = _player_info_map(available_players_df)
+    
     with col_select:
         # Create a searchable selectbox
-        player_options = available_players_df[['player_id', 'name']].copy()
-        player_options['display'] = player_options['name'] + f" (ID: " + player_options['player_id'].astype(str) + ")"
-        
         selected_player = st.selectbox(
             "🔍 Select a player to analyze:",
-            options=player_options['display'].tolist(),
+            options=display_options,
             help="Choose a player and click 'Analyze Trends' to view their historical performance"
         )
         
@@ -170,23 +313,18 @@ def render_draft_historical_trends_tab(available_players_df: pd.DataFrame,
         
         if selected_player and analyze_clicked:
             # Extract player info
-            selected_idx = player_options[player_options['display'] == selected_player].index[0]
-            player_id = player_options.loc[selected_idx, 'player_id']
-            player_name = player_options.loc[selected_idx, 'name']
-            
-            # Get player info from the available players df
-            player_info = available_players_df[available_players_df['player_id'] == player_id].iloc[0]
+            player_id = display_to_id[selected_player]
+            player_info = info_by_id[player_id]
             
             # Store in session state to persist the analysis
             st.session_state.trends_player_id = player_id
-            st.session_state.trends_player_name = player_name
+            st.session_state.trends_player_name = player_info['name']
             st.session_state.trends_player_info = player_info
     
     with col_info:
         if selected_player:
             # Show basic info even before analysis
-            selected_idx = player_options[player_options['display'] == selected_player].index[0]
-            player_info = available_players_df[available_players_df['player_id'] == player_options.loc[selected_idx, 'player_id']].iloc[0]
+            player_info = info_by_id[display_to_id[selected_player]]
             
             st.markdown("**Player Info:**")
             st.markdown(f"**Team:** {player_info.get('team', 'N/A')}")
@@ -195,9 +333,7 @@ def render_draft_historical_trends_tab(available_players_df: pd.DataFrame,
             st.markdown(f"**ADP:** {player_info.get('adp', 'N/A')}")
     
     # Show analysis if player has been confirmed
-    if (hasattr(st.session_state, 'trends_player_id') and 
-        hasattr(st.session_state, 'trends_player_name') and 
-        hasattr(st.session_state, 'trends_player_info')):
+    if TRENDS_SESSION_KEYS.issubset(st.session_state):
         
         player_id = st.session_state.trends_player_id
         player_name = st.session_state.trends_player_name
@@ -237,122 +373,18 @@ def render_draft_historical_trends_tab(available_players_df: pd.DataFrame,
                 st.markdown("---")
                 st.markdown("#### 🏀 Key Performance Trends")
                 
-                # Organize stats in a grid
-                stat_names = {
-                    'points_per_game': 'Points',
-                    'rebounds_per_game': 'Rebounds', 
-                    'assists_per_game': 'Assists',
-                    'steals_per_game': 'Steals',
-                    'blocks_per_game': 'Blocks'
-                }
-                
-                # Create 3 columns for sparklines
-                cols = st.columns(3)
-                
-                for i, (stat_key, stat_display) in enumerate(stat_names.items()):
-                    if stat_key in sparklines:
-                        sparkline_data = sparklines[stat_key]
-                        values = sparkline_data.get('values', [])
-                        seasons = sparkline_data.get('seasons', [])
-                        trend = sparkline_data.get('trend', 'stable')
-                        latest_value = sparkline_data.get('latest_value')
-                        change_from_previous = sparkline_data.get('change_from_previous')
-                        
-                        with cols[i % 3]:
-                            # Trend emoji
-                            trend_emojis = {
-                                'increasing': '📈',
-                                'decreasing': '📉', 
-                                'stable': '➡️',
-                                'volatile': '📊'
-                            }
-                            
-                            st.markdown(f"**{trend_emojis.get(trend, '📊')} {stat_display}**")
-                            
-                            if values:
-                                # Create compact sparkline
-                                fig = create_compact_sparkline(values, seasons, stat_display, trend)
-                                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-                                
-                                # Show current value and change
-                                if latest_value is not None:
-                                    delta_str = f"{change_from_previous:+.1f}" if change_from_previous is not None else None
-                                    st.metric("", f"{latest_value:.1f}", delta=delta_str)
-                            else:
-                                st.markdown("*No data*")
+                _render_stat_grid(KEY_TREND_STATS, sparklines)
                 
-                # Efficiency stats
+                # Secondary sections stay collapsed until the user opens them
                 st.markdown("---")
-                st.markdown("#### 🎯 Shooting Efficiency Trends")
+                with st.expander("🎯 Shooting Efficiency Trends", expanded=False):
+                    _render_stat_grid(EFFICIENCY_TREND_STATS, sparklines, pct_keys=PERCENTAGE_TREND_STATS)
                 
-                efficiency_stats = {
-                    'fg_pct': 'FG%',
-                    'ft_pct': 'FT%',
-                    'three_pm': '3PM'
-                }
-                
-                eff_cols = st.columns(3)
-                
-                for i, (stat_key, stat_display) in enumerate(efficiency_stats.items()):
-                    if stat_key in sparklines:
-                        sparkline_data = sparklines[stat_key]
-                        values = sparkline_data.get('values', [])
-                        seasons = sparkline_data.get('seasons', [])
-                        trend = sparkline_data.get('trend', 'stable')
-                        latest_value = sparkline_data.get('latest_value')
-                        change_from_previous = sparkline_data.get('change_from_previous')
-                        
-                        with eff_cols[i]:
-                            trend_emojis = {
-                                'increasing': '📈',
-                                'decreasing': '📉',
-                                'stable': '➡️', 
-                                'volatile': '📊'
-                            }
-                            
-                            st.markdown(f"**{trend_emojis.get(trend, '📊')} {stat_display}**")
-                            
-                            if values:
-                                fig = create_compact_sparkline(values, seasons, stat_display, trend)
-                                st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-                                
-                                if latest_value is not None:
-                                    if stat_key in ['fg_pct', 'ft_pct']:
-                                        # Show as percentage
-                                        st.metric("", f"{latest_value:.1%}")
-                                    else:
-                                        delta_str = f"{change_from_previous:+.1f}" if change_from_previous is not None else None
-                                        st.metric("", f"{latest_value:.1f}", delta=delta_str)
-                            else:
-                                st.markdown("*No data*")
-                
-                # Draft insights
-                st.markdown("---")
-                st.markdown("#### 💡 Draft Insights")
-                
-                insights = []
-                
-                # Generate insights based on trends
-                if trend_counts['increasing'] >= 3:
-                    insights.append("🔥 **Rising Star**: Multiple stats trending upward - could be a breakout candidate")
-                elif trend_counts['decreasing'] >= 3:
-                    insights.append("⚠️ **Declining Performance**: Multiple stats trending downward - consider carefully")
-                
-                if trend_counts['volatile'] >= 2:
-                    insights.append("📊 **High Volatility**: Inconsistent performance - higher risk/reward player")
-                
-                if trend_counts['stable'] >= 3:
-                    insights.append("🎯 **Consistent Performer**: Stable production - reliable floor")
-                
-                # Age-based insights (if we had age data)
-                if sparklines.get('points_per_game', {}).get('trend') == 'increasing':
-                    insights.append("📈 **Scoring Uptrend**: Points per game improving - offensive development")
-                
-                if not insights:
-                    insights.append("📊 **Mixed Trends**: Performance varies by category - analyze specific needs")
-                
-                for insight in insights:
-                    st.markdown(f"- {insight}")
+                with st.expander("💡 Draft Insights", expanded=False):
+                    insights = _trend_insights(trend_counts, sparklines)
+                    
+                    for insight in insights:
+                        st.markdown(f"- {insight}")
                 
             else:
                 st.info(f"📊 No historical trend data available for {player_name}")
@@ -362,10 +394,61 @@ def render_draft_historical_trends_tab(available_players_df: pd.DataFrame,
                 st.markdown("- Player was not active in recent seasons")
 
 
+def _trend_insights(trend_counts: Dict[str, int], sparklines: Dict[str, Any]) -> List[str]:
+    """
+    Pick the draft insights that apply to a player's trends.
+    
+    Args:
+        trend_counts: Number of stats per trend direction
+        sparklines: Sparkline data keyed by stat name
+        
+    Returns:
+        Insight messages, or the mixed-trends fallback if none apply
+    """
+    insights = []
+    for group in TREND_INSIGHT_RULES:
+        message = next(
+            (message for minimums, message in group
+             if all(trend_counts[trend] >= count for trend, count in minimums.items())),
+            None
+        )
+        if message:
+            insights.append(message)
+    
+    if sparklines.get('points_per_game', {}).get('trend') == 'increasing':
+        insights.append(SCORING_UPTREND_INSIGHT)
+    
+    return insights or [MIXED_TRENDS_INSIGHT]
+
+
+def _classify_trend_indicator(sparklines: Dict[str, Any]) -> str:
+    """
+    Summarize a player's sparklines as a single trend emoji.
+    
+    Args:
+        sparklines: Sparkline data keyed by stat name
+        
+    Returns:
+        📈 if more key stats are rising than falling, 📉 if the reverse, else ➡️
+    """
+    # Count trends
+    key_stats = ['points_per_game', 'rebounds_per_game', 'assists_per_game']
+    trend_counts = Counter(sparklines[stat].get('trend', 'stable') for stat in key_stats if stat in sparklines)
+    
+    # Assign indicator
+    if trend_counts['increasing'] > trend_counts['decreasing']:
+        return "📈"
+    elif trend_counts['decreasing'] > trend_counts['increasing']:
+        return "📉"
+    return "➡️"
+
+
 def render_quick_trend_indicators(player_ids: List[int], api_base_url: str = "http://localhost:8000") -> Dict[int, str]:
     """
     Get quick trend indicators for multiple players (for table display).
     
+    All players' sparklines come back from a single bulk request.
+    
     Args:
         player_ids: List of player IDs
         api_base_url: Base URL for the API
@@ -373,36 +456,21 @@ def render_quick_trend_indicators(player_ids: List[int], api_base_url: str = "ht
     Returns:
         Dictionary mapping player_id to trend indicator emoji
     """
-    trend_indicators = {}
+    player_ids = [int(pid) for pid in player_ids[:QUICK_TREND_MAX_PLAYERS]]  # Limit to top 10 to keep the table responsive
     
-    for player_id in player_ids[:10]:  # Limit to top 10 to avoid too many API calls
-        try:
-            response = requests.get(f"{api_base_url}/api/historical/player/{player_id}/sparklines?seasons_back=3", timeout=1)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                # Count trends
-                trend_counts = {'increasing': 0, 'decreasing': 0}
-                key_stats = ['points_per_game', 'rebounds_per_game', 'assists_per_game']
-                
-                for stat in key_stats:
-                    if stat in data:
-                        trend = data[stat].get('trend', 'stable')
-                        if trend in trend_counts:
-                            trend_counts[trend] += 1
-                
-                # Assign indicator
-                if trend_counts['increasing'] > trend_counts['decreasing']:
-                    trend_indicators[player_id] = "📈"
-                elif trend_counts['decreasing'] > trend_counts['increasing']:
-                    trend_indicators[player_id] = "📉"
-                else:
-                    trend_indicators[player_id] = "➡️"
-            else:
-                trend_indicators[player_id] = "❓"
-                
-        except:
-            trend_indicators[player_id] = "❓"
+    try:
+        response = get_api_session().post(
+            f"{api_base_url}/api/historical/players/sparklines",
+            json={"player_ids": player_ids, "seasons_back": 3},
+            timeout=2
+        )
+        response.raise_for_status()
+        # JSON object keys come back as strings
+        sparklines_by_player = {int(pid): sparklines for pid, sparklines in response.json().items()}
+    except Exception:
+        sparklines_by_player = {}
     
-    return trend_indicators 
\ No newline at end of file
+    return {
+        pid: _classify_trend_indicator(sparklines_by_player[pid]) if pid in sparklines_by_player else "❓"
+        for pid in player_ids
+    }
@@ -3,11 +3,168 @@ The Lineup - Draft Logic Components
 Modular draft state management and AI pick suggestions
 """
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+from collections import Counter
 from typing import List, Dict, Any, Optional, Tuple
 
 
+# Pick suggestion tiers: (comparison, threshold, bonus, reason) checked in
+# order, the first match applies. Reason None scores without explaining.
+PUNT_FIT_TIERS = (
+    (np.greater, 5, 15, "Excellent punt strategy fit"),
+    (np.greater, 3, 10, "Good punt strategy fit"),
+    (np.greater, 1, 5, "Decent punt strategy fit")
+)
+Z_SCORE_TIERS = (
+    (np.greater, 10, 15, "Elite tier player"),
+    (np.greater, 7, 10, "High-tier option"),
+    (np.greater, 4, 5, "Solid contributor")
+)
+ADVANCED_STAT_TIERS = (
+    ('usage_rate', (
+        (np.greater, 0.28, 3, "High usage player"),
+        (np.greater, 0.25, 1, "Above average usage")
+    )),
+    ('true_shooting_pct', (
+        (np.greater, 0.60, 4, "Elite shooting efficiency"),
+        (np.greater, 0.55, 2, "Good shooting efficiency"),
+        (np.less, 0.50, -2, "Below average efficiency")
+    )),
+    ('player_efficiency_rating', (
+        (np.greater, 25, 3, "Elite PER"),
+        (np.greater, 20, 2, "Strong PER"),
+        (np.greater, 15, 1, None)
+    )),
+    ('age', (
+        (np.less_equal, 25, 2, "Young with upside"),
+        (np.less_equal, 27, 1, "Prime age"),
+        (np.greater_equal, 32, -1, "Veteran (age risk)")
+    )),
+    ('games_played', (
+        (np.greater_equal, 70, 1, "Durable (70+ games)"),
+        (np.less, 50, -2, "Injury concerns")
+    ))
+)
+
+
+def _tier_levels(values: np.ndarray, tiers: Tuple) -> np.ndarray:
+    """
+    Find the first matching tier for each value.
+    
+    Args:
+        values: Values to classify (NaN matches no tier)
+        tiers: Tier tuples of (comparison, threshold, bonus, reason)
+        
+    Returns:
+        1-based tier index per value, 0 where no tier matches
+    """
+    conditions = [compare(values, threshold) for compare, threshold, _, _ in tiers]
+    return np.select(conditions, np.arange(1, len(tiers) + 1), 0)
+
+
+def _tier_bonuses(levels: np.ndarray, tiers: Tuple) -> np.ndarray:
+    """Map tier levels from _tier_levels to their score bonuses."""
+    return np.array([0] + [bonus for _, _, bonus, _ in tiers])[levels]
+
+
+# Category status codes, indexing the label, color and emoji tables below.
+# STATUS_NO_DATA is only used for teams without players.
+STATUS_STRONG, STATUS_AVERAGE, STATUS_WEAK, STATUS_NO_DATA = range(4)
+STATUS_LABELS = ('strong', 'average', 'weak', 'average')
+STATUS_COLORS = ('#28A745', '#FFC107', '#DC3545', '#6C757D')  # Green, yellow, red, gray
+STATUS_EMOJIS = ('🟢', '🟡', '🔴', '⚪')
+
+# Percentile cut points between the bottom, middle and top thirds of the
+# league, and the status code of each resulting bucket
+STATUS_PERCENTILE_CUTS = np.array([0.33, 0.67])
+STATUS_BY_PERCENTILE_BUCKET = np.array([STATUS_WEAK, STATUS_AVERAGE, STATUS_STRONG])
+
+# Ordinal labels ("1st", "2nd", ...) for every rank a league can produce
+RANK_ORDINALS = tuple(
+    f"{rank}{'th' if 10 <= rank % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(rank % 10, 'th')}"
+    for rank in range(100)
+)
+
+# Punt detection criteria in priority order: (confidence, reason template)
+PUNT_CRITERIA = (
+    ('high', "Ranked {rank_suffix} of {total_teams} teams with weak total"),
+    ('medium', "Last place ({rank_suffix}) with very weak total ({team_total:.1f})"),
+    ('medium', "Extremely low team total ({team_total:.1f})"),
+    ('medium', "Very high turnover total ({team_total:.1f})"),
+    ('medium', "{poor_performers}/{total_players} players significantly below average")
+)
+
+# Punt strategy recommendations by punted category (turnovers: punting
+# means accepting high turnovers)
+PUNT_RECOMMENDATIONS = {
+    'z_ft_pct': (
+        "Target high-volume, low-FT% players (Giannis, Simmons, Drummond types)",
+        "Prioritize big men who get blocks/rebounds but hurt FT%",
+        "Avoid guards who rely on free throws for scoring"
+    ),
+    'z_fg_pct': (
+        "Target high-volume scorers regardless of efficiency",
+        "Prioritize players with high usage rates and 3PM",
+        "Focus on assists, steals, and counting stats over shooting %"
+    ),
+    'z_three_pm': (
+        "Focus on traditional big men (centers, power forwards)",
+        "Target players strong in rebounds, blocks, FG%",
+        "Don't worry about 3-point shooting from your picks"
+    ),
+    'z_assists': (
+        "Target scoring-focused guards and wings",
+        "Prioritize big men who contribute in other categories",
+        "Focus on points, rebounds, blocks over playmaking"
+    ),
+    'z_steals': (
+        "Focus on big men and low-steal guards",
+        "Prioritize size and interior presence",
+        "Target players strong in blocks, rebounds, scoring"
+    ),
+    'z_blocks': (
+        "Target guards and small forwards",
+        "Focus on perimeter stats (3PM, assists, steals)",
+        "Don't prioritize interior presence"
+    ),
+    'z_turnovers': (
+        "Target high-usage, high-assist players",
+        "Focus on playmakers who handle the ball frequently",
+        "Prioritize offensive production over ball security"
+    ),
+    'z_rebounds': (
+        "Target guards and perimeter players",
+        "Focus on assists, steals, 3PM, and scoring",
+        "Don't prioritize size or interior presence"
+    ),
+    'z_points': (
+        "Target defensive specialists and role players",
+        "Focus on efficiency stats (FG%, FT%) and defensive stats",
+        "Prioritize assists, steals, blocks over scoring"
+    )
+}
+
+# Position groups for roster balance warnings. Other positions fall back to
+# their primary position (the part before any '-').
+POSITION_BALANCE_GROUPS = {
+    'Guard': 'Guard',
+    'Point Guard': 'Guard',
+    'Shooting Guard': 'Guard',
+    'Forward': 'Forward',
+    'Small Forward': 'Forward',
+    'Power Forward': 'Forward',
+    'Center': 'Center',
+    'Forward-Center': 'Big',  # Hybrid big man
+    'Center-Forward': 'Big',  # Hybrid big man
+    'Guard-Forward': 'Wing'   # Hybrid wing
+}
+
+# Category analyses memoized per CategoryAnalyzer before the memo is reset
+ANALYSIS_CACHE_SIZE = 64
+
+
 class CategoryAnalyzer:
     """Analyzes team category strengths and weaknesses."""
     
@@ -26,8 +183,34 @@ class CategoryAnalyzer:
     
     def __init__(self, player_pool_df: pd.DataFrame):
         self.player_pool_df = player_pool_df
+        
+        self._pool_index = get_player_pool_index(player_pool_df)
+        self._analysis_cache: Dict[Tuple, Dict[str, Any]] = {}
+    
+    def _roster_rows(self, roster_ids: List[str]) -> np.ndarray:
+        """Get the pool row positions of rostered players, in pool order."""
+        player_rows = self._pool_index.player_rows
+        return np.unique(np.fromiter(
+            (player_rows[player_id] for player_id in roster_ids if player_id in player_rows),
+            dtype=np.intp
+        ))
+    
+    def get_roster_players(self, roster_ids: List[str]) -> pd.DataFrame:
+        """
+        Get the pool rows for rostered players, in pool order.
+        
+        Uses the pool index rather than scanning the player_id column.
+        
+        Args:
+            roster_ids: List of player IDs in the roster
+            
+        Returns:
+            DataFrame of rostered players
+        """
+        return self.player_pool_df.iloc[self._roster_rows(roster_ids)]
     
-    def analyze_team_categories(self, roster_ids: List[str], all_team_rosters: Dict[int, List[str]] = None, user_team_id: int = None) -> Dict[str, Any]:
+    def analyze_team_categories(self, roster_ids: List[str], all_team_rosters: Dict[int, List[str]] = None, user_team_id: int = None,
+                                team_totals: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Analyze team's category strengths and weaknesses relative to other teams.
         
@@ -35,49 +218,64 @@ class CategoryAnalyzer:
             roster_ids: List of player IDs in the roster
             all_team_rosters: Dictionary of all team rosters {team_id: [player_ids]}
             user_team_id: ID of the user's team
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
             
         Returns:
             Dictionary with category analysis including relative rankings
+            (shared between identical calls, so treat it as read-only)
         """
+        # team_totals is derived from the rosters, so the rosters alone key the memo
+        cache_key = (
+            tuple(roster_ids),
+            tuple((team_id, tuple(roster)) for team_id, roster in all_team_rosters.items()) if all_team_rosters else None,
+            user_team_id
+        )
+        category_analysis = self._analysis_cache.get(cache_key)
+        if category_analysis is None:
+            if len(self._analysis_cache) >= ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            category_analysis = self._analyze_team_categories(roster_ids, all_team_rosters, user_team_id, team_totals)
+            self._analysis_cache[cache_key] = category_analysis
+        return category_analysis
+    
+    def _analyze_team_categories(self, roster_ids: List[str], all_team_rosters: Optional[Dict[int, List[str]]],
+                                 user_team_id: Optional[int], team_totals: Optional[np.ndarray]) -> Dict[str, Any]:
+        """Build the category analysis for analyze_team_categories."""
         if not roster_ids:
             return self._get_empty_analysis()
         
-        # Get roster players with z-scores
-        roster_df = self.player_pool_df[self.player_pool_df["player_id"].isin(roster_ids)]
+        # Get roster rows with z-scores
+        roster_rows = self._roster_rows(roster_ids)
         
-        if roster_df.empty:
+        if roster_rows.size == 0:
             return self._get_empty_analysis()
         
         category_analysis = {}
         
-        # Calculate team rankings if we have all team data
-        team_rankings = {}
-        if all_team_rosters and user_team_id:
-            team_rankings = self._calculate_team_rankings(all_team_rosters)
+        user_ranks, total_teams, statuses = self._rank_categories(all_team_rosters, user_team_id, team_totals)
         
-        for z_col, info in self.CATEGORIES.items():
-            if z_col in roster_df.columns:
-                # Calculate team total for this category
-                team_total = roster_df[z_col].sum()
-                team_avg = roster_df[z_col].mean()
-                
-                # Get relative ranking info
-                ranking_info = team_rankings.get(z_col, {})
-                user_rank = ranking_info.get('rankings', {}).get(user_team_id, None)
-                total_teams = ranking_info.get('total_teams', 1)
-                
-                # Determine status based on relative ranking
-                status = self._get_category_status_relative(user_rank, total_teams, info['good_direction'])
+        # Team totals and averages for every category at once (missing z-scores are skipped)
+        category_totals = self._pool_index.z_matrix[roster_rows].sum(axis=0)
+        present_counts = self._pool_index.category_present[roster_rows].sum(axis=0)
+        category_avgs = np.divide(category_totals, present_counts,
+                                  out=np.full(len(CATEGORY_FIELDS), np.nan), where=present_counts > 0)
+        
+        for i, (z_col, name, short, good_direction) in enumerate(CATEGORY_FIELDS):
+            if z_col in self._pool_index.category_columns:
+                team_total = category_totals[i]
+                team_avg = category_avgs[i]
+                user_rank = int(user_ranks[i]) if user_ranks is not None else None
+                status = statuses[i]
                 
                 category_analysis[z_col] = {
-                    'name': info['name'],
-                    'short': info['short'],
+                    'name': name,
+                    'short': short,
                     'team_total': team_total,
                     'team_avg': team_avg,
-                    'status': status,
-                    'color': self._get_status_color(status),
-                    'emoji': self._get_status_emoji(status),
-                    'good_direction': info['good_direction'],
+                    'status': STATUS_LABELS[status],
+                    'color': STATUS_COLORS[status],
+                    'emoji': STATUS_EMOJIS[status],
+                    'good_direction': good_direction,
                     'rank': user_rank,
                     'total_teams': total_teams,
                     'rank_suffix': self._get_rank_suffix(user_rank) if user_rank else None
@@ -85,78 +283,105 @@ class CategoryAnalyzer:
         
         return category_analysis
     
-    def _calculate_team_rankings(self, all_team_rosters: Dict[int, List[str]]) -> Dict[str, Dict]:
+    def _rank_categories(self, all_team_rosters: Optional[Dict[int, List[str]]], user_team_id: Optional[int],
+                         team_totals: Optional[np.ndarray] = None) -> Tuple[Optional[np.ndarray], int, np.ndarray]:
         """
-        Calculate rankings for all teams across all categories.
+        Rank the user's team in every category and derive category statuses.
         
         Args:
             all_team_rosters: Dictionary of all team rosters
+            user_team_id: ID of the user's team
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
             
         Returns:
-            Dictionary with ranking information for each category
+            Tuple of (user rank per category or None, teams with players, status code per category)
         """
-        team_rankings = {}
+        # Rank the user's team if we have all team data
+        user_ranks = None
+        total_teams = 1
+        if all_team_rosters and user_team_id:
+            user_ranks = self._calculate_user_ranks(all_team_rosters, user_team_id, team_totals)
+            total_teams = len([t for t in all_team_rosters.keys() if all_team_rosters[t]])  # Only count teams with players
         
-        for z_col, info in self.CATEGORIES.items():
-            if z_col in self.player_pool_df.columns:
-                team_totals = {}
-                
-                # Calculate totals for each team
-                for team_id, roster_ids in all_team_rosters.items():
-                    if roster_ids:  # Only calculate for teams with players
-                        team_df = self.player_pool_df[self.player_pool_df["player_id"].isin(roster_ids)]
-                        if not team_df.empty:
-                            team_totals[team_id] = team_df[z_col].sum()
-                        else:
-                            team_totals[team_id] = 0
-                    else:
-                        team_totals[team_id] = 0
-                
-                # Sort teams by total (ascending for turnovers, descending for others)
-                reverse_sort = info['good_direction'] == 'high'
-                sorted_teams = sorted(team_totals.items(), key=lambda x: x[1], reverse=reverse_sort)
-                
-                # Create rankings (1st, 2nd, 3rd, etc.)
-                rankings = {}
-                for rank, (team_id, total) in enumerate(sorted_teams, 1):
-                    rankings[team_id] = rank
-                
-                team_rankings[z_col] = {
-                    'rankings': rankings,
-                    'totals': team_totals,
-                    'total_teams': len([t for t in all_team_rosters.keys() if all_team_rosters[t]])  # Only count teams with players
-                }
+        # Determine status based on relative ranking
+        return user_ranks, total_teams, self._get_category_status_relative(user_ranks, total_teams)
+    
+    def _calculate_user_ranks(self, all_team_rosters: Dict[int, List[str]], user_team_id: int,
+                              team_totals: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
+        """
+        Rank the user's team against every team in each category.
         
-        return team_rankings
+        Args:
+            all_team_rosters: Dictionary of all team rosters
+            user_team_id: ID of the user's team
+            team_totals: Optional (teams x categories) totals in all_team_rosters order;
+                summed from the player pool when not provided
+            
+        Returns:
+            1-based rank per category in CATEGORY_FIELDS order (1 = best),
+            or None if the user's team isn't in all_team_rosters
+        """
+        if user_team_id not in all_team_rosters:
+            return None
+        
+        if team_totals is None:
+            team_totals = self._sum_team_totals(all_team_rosters)
+        
+        # Count teams ahead of the user: a better total (lower for turnovers),
+        # or an equal total from a team listed earlier
+        signed_totals = team_totals * CATEGORY_SIGNS
+        user_row = list(all_team_rosters).index(user_team_id)
+        user_totals = signed_totals[user_row]
+        listed_earlier = (np.arange(len(signed_totals)) < user_row)[:, np.newaxis]
+        ahead = (signed_totals > user_totals) | ((signed_totals == user_totals) & listed_earlier)
+        
+        return ahead.sum(axis=0) + 1
+    
+    def _sum_team_totals(self, all_team_rosters: Dict[int, List[str]]) -> np.ndarray:
+        """
+        Sum every team's category z-scores from the player pool.
+        
+        Args:
+            all_team_rosters: Dictionary of all team rosters
+            
+        Returns:
+            (teams x categories) array of totals in all_team_rosters order
+        """
+        category_cols = list(self.CATEGORIES)
+        
+        # Join every (team, player) pair to the pool once and sum all categories per team
+        pairs = pd.DataFrame(
+            [(team_id, player_id) for team_id, roster_ids in all_team_rosters.items() for player_id in roster_ids],
+            columns=['team_id', 'player_id']
+        )
+        pool_categories = self.player_pool_df.reindex(columns=['player_id'] + category_cols)
+        merged = pairs.merge(pool_categories, on='player_id')
+        totals = merged.groupby('team_id')[category_cols].sum().reindex(list(all_team_rosters), fill_value=0)
+        
+        return totals.to_numpy(dtype=float)
     
-    def _get_category_status_relative(self, rank: Optional[int], total_teams: int, good_direction: str) -> str:
+    def _get_category_status_relative(self, ranks: Optional[np.ndarray], total_teams: int) -> np.ndarray:
         """
-        Determine category status based on relative ranking among teams.
+        Determine category statuses based on relative ranking among teams.
         
         Args:
-            rank: Team's rank in this category (1 = best)
+            ranks: Team's rank per category in CATEGORY_FIELDS order (1 = best)
             total_teams: Total number of teams with players
-            good_direction: Whether high or low values are good
             
         Returns:
-            Status string: 'strong', 'average', or 'weak'
+            Status code per category: STATUS_STRONG, STATUS_AVERAGE, or STATUS_WEAK
         """
-        if rank is None or total_teams <= 1:
-            return 'average'
-        
-        # Calculate percentile position
-        percentile = (total_teams - rank + 1) / total_teams
-        
-        # Determine status based on ranking
-        if percentile >= 0.67:  # Top third
-            return 'strong'
-        elif percentile >= 0.33:  # Middle third
-            return 'average'
-        else:  # Bottom third
-            return 'weak'
+        if ranks is None or total_teams <= 1:
+            return np.full(len(CATEGORY_FIELDS), STATUS_AVERAGE)
+        
+        # Calculate percentile position: top third strong, middle third average, bottom third weak
+        percentiles = (total_teams - ranks + 1) / total_teams
+        return STATUS_BY_PERCENTILE_BUCKET[np.digitize(percentiles, STATUS_PERCENTILE_CUTS)]
     
     def _get_rank_suffix(self, rank: int) -> str:
         """Get ordinal suffix for ranking (1st, 2nd, 3rd, etc.)."""
+        if rank < len(RANK_ORDINALS):
+            return RANK_ORDINALS[rank]
         if 10 <= rank % 100 <= 20:
             suffix = 'th'
         else:
@@ -191,44 +416,27 @@ class CategoryAnalyzer:
             else:
                 return 'weak'
     
-    def _get_status_color(self, status: str) -> str:
-        """Get color for status."""
-        colors = {
-            'strong': '#28A745',  # Green
-            'average': '#FFC107',  # Yellow
-            'weak': '#DC3545'     # Red
-        }
-        return colors.get(status, '#6C757D')
-    
-    def _get_status_emoji(self, status: str) -> str:
-        """Get emoji for status."""
-        emojis = {
-            'strong': '🟢',
-            'average': '🟡', 
-            'weak': '🔴'
-        }
-        return emojis.get(status, '⚪')
-    
     def _get_empty_analysis(self) -> Dict[str, Any]:
         """Return empty analysis for teams with no players."""
         analysis = {}
-        for z_col, info in self.CATEGORIES.items():
+        for z_col, name, short, good_direction in CATEGORY_FIELDS:
             analysis[z_col] = {
-                'name': info['name'],
-                'short': info['short'],
+                'name': name,
+                'short': short,
                 'team_total': 0,
                 'team_avg': 0,
-                'status': 'average',
-                'color': '#6C757D',
-                'emoji': '⚪',
-                'good_direction': info['good_direction'],
+                'status': STATUS_LABELS[STATUS_NO_DATA],
+                'color': STATUS_COLORS[STATUS_NO_DATA],
+                'emoji': STATUS_EMOJIS[STATUS_NO_DATA],
+                'good_direction': good_direction,
                 'rank': None,
                 'total_teams': 1,
                 'rank_suffix': None
             }
         return analysis
     
-    def get_priority_needs(self, roster_ids: List[str], all_team_rosters: Dict[int, List[str]] = None, user_team_id: int = None) -> List[str]:
+    def get_priority_needs(self, roster_ids: List[str], all_team_rosters: Dict[int, List[str]] = None, user_team_id: int = None,
+                           team_totals: Optional[np.ndarray] = None) -> List[str]:
         """
         Get list of category z-score columns that are weak and need improvement.
         
@@ -236,21 +444,39 @@ class CategoryAnalyzer:
             roster_ids: List of player IDs in the roster
             all_team_rosters: Dictionary of all team rosters
             user_team_id: ID of the user's team
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
             
         Returns:
             List of z-score column names that are weak
         """
-        analysis = self.analyze_team_categories(roster_ids, all_team_rosters, user_team_id)
-        weak_categories = []
-        
-        for z_col, data in analysis.items():
-            if data['status'] == 'weak':
-                weak_categories.append(z_col)
+        return self._weak_category_ids(roster_ids, all_team_rosters, user_team_id, team_totals)
+    
+    def _weak_category_ids(self, roster_ids: List[str], all_team_rosters: Optional[Dict[int, List[str]]],
+                           user_team_id: Optional[int], team_totals: Optional[np.ndarray] = None) -> List[str]:
+        """
+        Get the weak category columns without building the full category analysis.
         
-        return weak_categories
+        Args:
+            roster_ids: List of player IDs in the roster
+            all_team_rosters: Dictionary of all team rosters
+            user_team_id: ID of the user's team
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
+            
+        Returns:
+            List of z-score column names that are weak
+        """
+        if not roster_ids or self._roster_rows(roster_ids).size == 0:
+            return []
+        
+        _, _, statuses = self._rank_categories(all_team_rosters, user_team_id, team_totals)
+        return [
+            z_col for (z_col, _, _, _), status in zip(CATEGORY_FIELDS, statuses)
+            if status == STATUS_WEAK and z_col in self._pool_index.category_columns
+        ]
     
     def detect_punt_strategies(self, roster_ids: List[str], all_team_rosters: Dict[int, List[str]] = None, 
-                              user_team_id: int = None, min_players: int = 3) -> Dict[str, Any]:
+                              user_team_id: int = None, min_players: int = 3,
+                              team_totals: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Detect potential punt strategies based on team composition and rankings.
         
@@ -259,6 +485,7 @@ class CategoryAnalyzer:
             all_team_rosters: Dictionary of all team rosters
             user_team_id: ID of the user's team
             min_players: Minimum number of players needed to detect punt strategies
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
             
         Returns:
             Dictionary with punt strategy analysis
@@ -271,74 +498,65 @@ class CategoryAnalyzer:
                 'message': f"Need at least {min_players} players to detect punt strategies"
             }
         
-        analysis = self.analyze_team_categories(roster_ids, all_team_rosters, user_team_id)
-        roster_df = self.player_pool_df[self.player_pool_df["player_id"].isin(roster_ids)]
+        analysis = self.analyze_team_categories(roster_ids, all_team_rosters, user_team_id, team_totals)
+        roster_rows = self._roster_rows(roster_ids)
+        total_players = roster_rows.size
+        
+        # Players significantly below average, counted for every category in one pass
+        poor_counts = dict(zip(
+            (z_col for z_col, _, _, _ in CATEGORY_FIELDS),
+            (self._pool_index.z_matrix[roster_rows] < -1.0).sum(axis=0).tolist()
+        ))
         
         punt_candidates = []
         punt_recommendations = []
         
-        # More conservative punt detection criteria
-        for z_col, data in analysis.items():
+        # More conservative punt detection criteria, checked for every category
+        # at once; the first matching criterion (see PUNT_CRITERIA) applies
+        z_cols = list(analysis)
+        team_totals_by_category = np.array([analysis[z_col]['team_total'] for z_col in z_cols], dtype=float)
+        team_ranks = np.array([analysis[z_col].get('rank') or 0 for z_col in z_cols])
+        total_teams = np.array([analysis[z_col].get('total_teams', 1) for z_col in z_cols])
+        good_directions = np.array([self.CATEGORIES[z_col]['good_direction'] for z_col in z_cols])
+        poor_performers = np.array([poor_counts[z_col] for z_col in z_cols])
+        
+        # Only use rankings if we have multiple teams and clear ranking data
+        ranked = (team_ranks > 0) & (total_teams >= 6)  # Need at least 6 teams for meaningful comparison
+        criteria = np.select([
+            # 1: Bottom 20% in rankings with a negative total
+            ranked & (team_ranks >= total_teams * 0.80) & (team_totals_by_category < -1),
+            # 2: Last place with very weak total
+            ranked & (team_ranks == total_teams) & (team_totals_by_category < -2),
+            # 3: Extremely negative team total (rare cases without ranking)
+            ~ranked & (good_directions == 'high') & (team_totals_by_category < -4),
+            # 4: Extremely positive turnover total (bad for turnovers)
+            ~ranked & (good_directions == 'low') & (team_totals_by_category > 4),
+            # 5: Percentage categories where 75% of a 6+ player roster is significantly poor
+            ~ranked & np.isin(z_cols, ['z_fg_pct', 'z_ft_pct']) & (total_players >= 6)
+            & (poor_performers >= total_players * 0.75)
+        ], np.arange(1, len(PUNT_CRITERIA) + 1), 0)
+        
+        for i in np.flatnonzero(criteria):
+            z_col = z_cols[i]
+            data = analysis[z_col]
             category_info = self.CATEGORIES[z_col]
-            team_total = data['team_total']
-            team_rank = data.get('rank')
-            total_teams = data.get('total_teams', 1)
-            
-            # Punt detection criteria - more conservative
-            is_punt_candidate = False
-            confidence = 'low'
-            reason = ""
-            
-            # Only consider punt if we have multiple teams and clear ranking data
-            if team_rank and total_teams >= 6:  # Need at least 6 teams for meaningful comparison
-                
-                # Criteria 1: Bottom 20% in rankings (much more conservative than 25%)
-                bottom_quintile_threshold = total_teams * 0.80
-                if team_rank >= bottom_quintile_threshold and team_total < -1:  # Also require negative total
-                    is_punt_candidate = True
-                    confidence = 'high'
-                    reason = f"Ranked {data['rank_suffix']} of {total_teams} teams with weak total"
-                
-                # Criteria 2: Last place with very weak total
-                elif team_rank == total_teams and team_total < -2:
-                    is_punt_candidate = True
-                    confidence = 'medium'
-                    reason = f"Last place ({data['rank_suffix']}) with very weak total ({team_total:.1f})"
-            
-            # Criteria 3: Extremely negative team total (rare cases without ranking)
-            elif category_info['good_direction'] == 'high' and team_total < -4:  # Much more conservative threshold
-                is_punt_candidate = True
-                confidence = 'medium'
-                reason = f"Extremely low team total ({team_total:.1f})"
-            
-            # Criteria 4: Extremely positive turnover total (bad for turnovers) 
-            elif category_info['good_direction'] == 'low' and team_total > 4:  # More conservative threshold
-                is_punt_candidate = True
-                confidence = 'medium'
-                reason = f"Very high turnover total ({team_total:.1f})"
-            
-            # Criteria 5: Percentage categories with consistently poor performers (more conservative)
-            elif z_col in ['z_fg_pct', 'z_ft_pct'] and len(roster_df) >= 6:  # Need more players
-                # Check if most players are significantly below average
-                poor_performers = len(roster_df[roster_df[z_col] < -1.0])  # More stringent threshold
-                total_players = len(roster_df)
-                
-                if poor_performers >= total_players * 0.75:  # 75% of players must be significantly poor
-                    is_punt_candidate = True
-                    confidence = 'medium'
-                    reason = f"{poor_performers}/{total_players} players significantly below average"
-            
-            if is_punt_candidate:
-                punt_candidates.append({
-                    'category': z_col,
-                    'name': category_info['name'],
-                    'short': category_info['short'],
-                    'confidence': confidence,
-                    'reason': reason,
-                    'team_total': team_total,
-                    'rank': team_rank,
-                    'rank_suffix': data.get('rank_suffix', 'N/A')
-                })
+            confidence, reason_template = PUNT_CRITERIA[criteria[i] - 1]
+            punt_candidates.append({
+                'category': z_col,
+                'name': category_info['name'],
+                'short': category_info['short'],
+                'confidence': confidence,
+                'reason': reason_template.format(
+                    rank_suffix=data.get('rank_suffix'),
+                    total_teams=total_teams[i],
+                    team_total=data['team_total'],
+                    poor_performers=poor_performers[i],
+                    total_players=total_players
+                ),
+                'team_total': data['team_total'],
+                'rank': data.get('rank'),
+                'rank_suffix': data.get('rank_suffix', 'N/A')
+            })
         
         # Generate punt strategy recommendations only for high confidence punts
         if punt_candidates:
@@ -353,11 +571,11 @@ class CategoryAnalyzer:
             
             if high_confidence_punts:
                 for punt_cat in high_confidence_punts[:2]:  # Limit to top 2 high confidence punts
-                    recommendations = self._generate_punt_recommendations(punt_cat, roster_df)
+                    recommendations = self._generate_punt_recommendations(punt_cat)
                     punt_recommendations.extend(recommendations)
             elif punt_candidates and punt_candidates[0]['confidence'] == 'medium':
                 # Only include top medium confidence punt if no high confidence punts
-                recommendations = self._generate_punt_recommendations(punt_candidates[0], roster_df)
+                recommendations = self._generate_punt_recommendations(punt_candidates[0])
                 punt_recommendations.extend(recommendations)
         
         # Determine overall strategy confidence - much more conservative
@@ -380,88 +598,17 @@ class CategoryAnalyzer:
             'message': self._generate_punt_strategy_message(punt_candidates, strategy_confidence)
         }
     
-    def _generate_punt_recommendations(self, punt_category: Dict[str, Any], roster_df: pd.DataFrame) -> List[str]:
+    def _generate_punt_recommendations(self, punt_category: Dict[str, Any]) -> List[str]:
         """
         Generate specific recommendations for a punt strategy.
         
         Args:
             punt_category: Dictionary with punt category information
-            roster_df: DataFrame of current roster players
             
         Returns:
             List of recommendation strings
         """
-        recommendations = []
-        category = punt_category['category']
-        cat_name = punt_category['name']
-        cat_short = punt_category['short']
-        
-        # Category-specific punt recommendations
-        if category == 'z_ft_pct':
-            recommendations.extend([
-                f"Target high-volume, low-FT% players (Giannis, Simmons, Drummond types)",
-                f"Prioritize big men who get blocks/rebounds but hurt FT%",
-                f"Avoid guards who rely on free throws for scoring"
-            ])
-        
-        elif category == 'z_fg_pct':
-            recommendations.extend([
-                f"Target high-volume scorers regardless of efficiency",
-                f"Prioritize players with high usage rates and 3PM",
-                f"Focus on assists, steals, and counting stats over shooting %"
-            ])
-        
-        elif category == 'z_three_pm':
-            recommendations.extend([
-                f"Focus on traditional big men (centers, power forwards)",
-                f"Target players strong in rebounds, blocks, FG%",
-                f"Don't worry about 3-point shooting from your picks"
-            ])
-        
-        elif category == 'z_assists':
-            recommendations.extend([
-                f"Target scoring-focused guards and wings",
-                f"Prioritize big men who contribute in other categories",
-                f"Focus on points, rebounds, blocks over playmaking"
-            ])
-        
-        elif category == 'z_steals':
-            recommendations.extend([
-                f"Focus on big men and low-steal guards",
-                f"Prioritize size and interior presence",
-                f"Target players strong in blocks, rebounds, scoring"
-            ])
-        
-        elif category == 'z_blocks':
-            recommendations.extend([
-                f"Target guards and small forwards",
-                f"Focus on perimeter stats (3PM, assists, steals)",
-                f"Don't prioritize interior presence"
-            ])
-        
-        elif category == 'z_turnovers':
-            # Note: Low turnovers is good, so punting means accepting high turnovers
-            recommendations.extend([
-                f"Target high-usage, high-assist players",
-                f"Focus on playmakers who handle the ball frequently",
-                f"Prioritize offensive production over ball security"
-            ])
-        
-        elif category == 'z_rebounds':
-            recommendations.extend([
-                f"Target guards and perimeter players",
-                f"Focus on assists, steals, 3PM, and scoring",
-                f"Don't prioritize size or interior presence"
-            ])
-        
-        elif category == 'z_points':
-            recommendations.extend([
-                f"Target defensive specialists and role players",
-                f"Focus on efficiency stats (FG%, FT%) and defensive stats",
-                f"Prioritize assists, steals, blocks over scoring"
-            ])
-        
-        return recommendations[:3]  # Limit to top 3 recommendations
+        return list(PUNT_RECOMMENDATIONS.get(punt_category['category'], ()))[:3]  # Limit to top 3 recommendations
     
     def _generate_punt_strategy_message(self, punt_categories: List[Dict[str, Any]], confidence: str) -> str:
         """
@@ -512,51 +659,17 @@ class CategoryAnalyzer:
         if not punt_categories or available_players.empty:
             return available_players.head(top_n)
         
-        # Define non-punt categories (categories we want to be strong in)
-        all_categories = list(self.CATEGORIES.keys())
-        non_punt_categories = [cat for cat in all_categories if cat not in punt_categories]
-        
-        # Calculate punt-friendly score for each player
-        punt_scores = []
-        
-        for idx, player in available_players.iterrows():
-            punt_friendly_score = 0
-            
-            # Positive points for being strong in non-punt categories
-            for cat in non_punt_categories:
-                if cat in player and pd.notna(player[cat]):
-                    z_score = player[cat]
-                    # Adjust for turnovers (negative is good)
-                    if cat == 'z_turnovers':
-                        z_score = -z_score
-                    punt_friendly_score += max(0, z_score)  # Only positive contributions
-            
-            # Bonus for being weak in punt categories (we don't care about these)
-            for cat in punt_categories:
-                if cat in player and pd.notna(player[cat]):
-                    z_score = player[cat]
-                    # For punt categories, being weak is actually good for our strategy
-                    if cat == 'z_turnovers':
-                        # For turnovers, high turnovers (positive z-score) is bad normally,
-                        # but if we're punting turnovers, we don't care
-                        punt_friendly_score += 0  # Neutral
-                    else:
-                        # For other categories, being weak doesn't hurt our punt strategy
-                        punt_friendly_score += 0  # Neutral
-            
-            punt_scores.append(punt_friendly_score)
-        
-        # Add punt scores to dataframe and sort
-        available_with_scores = available_players.copy()
-        available_with_scores['punt_friendly_score'] = punt_scores
-        
-        # Sort by punt-friendly score, then by total z-score as tiebreaker
-        available_with_scores = available_with_scores.sort_values(
-            ['punt_friendly_score', 'total_z_score'], 
-            ascending=[False, False]
-        )
-        
-        return available_with_scores.head(top_n)
+        # Strength in non-punt categories: positive z-scores only, turnovers
+        # flipped, missing values ignored. Punt categories are neutral.
+        punt_scores = np.zeros(len(available_players))
+        for (cat, _, _, _), sign in zip(CATEGORY_FIELDS, CATEGORY_SIGNS):
+            if cat not in punt_categories and cat in available_players:
+                punt_scores += np.fmax(available_players[cat].to_numpy(dtype=float) * sign, 0)
+        
+        # Sort by punt-friendly score, then by total z-score as tiebreaker, and
+        # only copy the rows that are returned
+        order = np.lexsort((-available_players['total_z_score'].to_numpy(dtype=float), -punt_scores))[:top_n]
+        return available_players.iloc[order].assign(punt_friendly_score=punt_scores[order])
     
     def detect_roster_construction_warnings(self, roster_ids: List[str], min_players: int = 3) -> Dict[str, Any]:
         """
@@ -577,7 +690,8 @@ class CategoryAnalyzer:
             }
         
         # Get roster players with all available data
-        roster_df = self.player_pool_df[self.player_pool_df["player_id"].isin(roster_ids)]
+        roster_rows = self._roster_rows(roster_ids)
+        roster_df = self.player_pool_df.iloc[roster_rows]
         
         if roster_df.empty:
             return {
@@ -643,35 +757,10 @@ class CategoryAnalyzer:
         
         # 3. Position Balance Analysis
         if 'position' in roster_df.columns:
-            # Count positions (handle the actual database format)
-            position_counts = {}
-            multi_position_players = 0
-            
-            # Map actual position values to simplified categories
-            position_mapping = {
-                'Guard': 'Guard',
-                'Point Guard': 'Guard', 
-                'Shooting Guard': 'Guard',
-                'Forward': 'Forward',
-                'Small Forward': 'Forward',
-                'Power Forward': 'Forward', 
-                'Center': 'Center',
-                'Forward-Center': 'Big',  # Hybrid big man
-                'Center-Forward': 'Big',  # Hybrid big man
-                'Guard-Forward': 'Wing'   # Hybrid wing
-            }
-            
-            for pos_string in roster_df['position']:
-                if pd.notna(pos_string):
-                    # Handle hyphenated positions
-                    if '-' in pos_string:
-                        multi_position_players += 1
-                        # For hyphenated positions, use the mapping or primary position
-                        mapped_pos = position_mapping.get(pos_string, pos_string.split('-')[0])
-                    else:
-                        mapped_pos = position_mapping.get(pos_string, pos_string)
-                    
-                    position_counts[mapped_pos] = position_counts.get(mapped_pos, 0) + 1
+            # Count simplified position groups (mapped once per pool, see POSITION_BALANCE_GROUPS)
+            position_counts = Counter(
+                group for group in self._pool_index.balance_groups[roster_rows] if group is not None
+            )
             
             # Check for position imbalances using the actual position categories
             total_players = len(roster_df)
@@ -832,6 +921,85 @@ class CategoryAnalyzer:
         }
 
 
+# CategoryAnalyzer.CATEGORIES flattened for hot loops as (z_col, name, short,
+# good_direction), plus a sign per category: -1 where lower totals are better
+CATEGORY_FIELDS = tuple(
+    (z_col, info['name'], info['short'], info['good_direction'])
+    for z_col, info in CategoryAnalyzer.CATEGORIES.items()
+)
+CATEGORY_SIGNS = np.array([1 if good_direction == 'high' else -1 for _, _, _, good_direction in CATEGORY_FIELDS])
+
+
+class PlayerPoolIndex:
+    """Columnar lookups over a player pool, shared by the draft helpers."""
+    
+    def __init__(self, player_pool_df: pd.DataFrame):
+        # player_id -> pool row, the category columns the pool has, and the
+        # category matrix in CATEGORY_FIELDS order (missing values as 0, with
+        # a matching mask of which values were present)
+        self.player_ids = pd.Index(player_pool_df['player_id'])
+        self.player_rows = {player_id: row for row, player_id in enumerate(self.player_ids)}
+        self.category_columns = frozenset(
+            z_col for z_col, _, _, _ in CATEGORY_FIELDS if z_col in player_pool_df.columns
+        )
+        category_df = player_pool_df.reindex(columns=[z_col for z_col, _, _, _ in CATEGORY_FIELDS])
+        self.category_present = category_df.notna().to_numpy()
+        self.z_matrix = np.nan_to_num(category_df.to_numpy(dtype=float))
+        
+        # Position scarcity lookups: for each main position, a mask of the pool
+        # rows whose position contains it, plus a mask of elite (z > 5) players
+        positions = player_pool_df['position']
+        self.positions = positions.to_numpy()
+        self.balance_groups = np.array([
+            POSITION_BALANCE_GROUPS.get(position, position.split('-')[0]) if isinstance(position, str) else None
+            for position in self.positions
+        ], dtype=object)
+        self.elite_mask = (player_pool_df['total_z_score'] > 5).to_numpy()
+        self.position_buckets = {
+            main_position: positions.str.contains(main_position, na=False).to_numpy()
+            for main_position in positions.dropna().str.split('-').str[0].unique()
+        }
+        # Elite row -> the position buckets it counts toward
+        self.elite_row_positions = {
+            row: [main_position for main_position, bucket in self.position_buckets.items() if bucket[row]]
+            for row in np.flatnonzero(self.elite_mask)
+        }
+
+
+@st.cache_resource(max_entries=4)
+def get_player_pool_index(player_pool_df: pd.DataFrame) -> PlayerPoolIndex:
+    """
+    Build the columnar index for a player pool, once per distinct pool.
+    
+    Streamlit keys the cache on the DataFrame's contents, so every rerun that
+    passes the same pool gets the same index object back.
+    
+    Args:
+        player_pool_df: Full player pool DataFrame
+        
+    Returns:
+        Shared PlayerPoolIndex for the pool
+    """
+    return PlayerPoolIndex(player_pool_df)
+
+
+@st.cache_resource(max_entries=4)
+def get_category_analyzer(player_pool_df: pd.DataFrame) -> CategoryAnalyzer:
+    """
+    Get the shared CategoryAnalyzer for a player pool.
+    
+    Sharing one analyzer across reruns and callers lets its memoized
+    category analyses (keyed on roster contents) be reused between them.
+    
+    Args:
+        player_pool_df: Full player pool DataFrame
+        
+    Returns:
+        CategoryAnalyzer for the pool
+    """
+    return CategoryAnalyzer(player_pool_df)
+
+
 class DraftState:
     """Manages draft state and progression."""
     
@@ -844,20 +1012,94 @@ class DraftState:
         self.drafted_players = []
         self.team_rosters = {i: [] for i in range(1, num_teams + 1)}
         self.user_team_id = draft_position
-        self.draft_order = list(range(1, num_teams + 1))
         self.complete = False
         self.status_message = ""
+        
+        # Per-team category z-score totals (row = team_id - 1), kept current by
+        # draft_player once a player pool is bound
+        self.team_totals: Optional[np.ndarray] = None
+        # Pool rows not yet drafted, flipped off by draft_player
+        self.available_mask: Optional[np.ndarray] = None
+        # Position counts across the user's roster ("Guard-Forward" counts
+        # once for each), kept current alongside team_totals
+        self.user_position_counts: Optional[Counter] = None
+        # Undrafted elite (z > 5) players per main position, as counted by
+        # PickSuggestionEngine for position scarcity
+        self.elite_by_position: Optional[Dict[str, int]] = None
+        self._pool_index: Optional[PlayerPoolIndex] = None
+        # Every pool row before this one has been drafted (see next_available_row)
+        self._available_cursor = 0
+    
+    def bind_player_pool(self, player_pool_df: pd.DataFrame):
+        """
+        Attach the player pool so per-pick caches can be updated incrementally.
+        
+        Caches are rebuilt from the current rosters whenever the pool changes,
+        which also covers states restored from a save.
+        
+        Args:
+            player_pool_df: Full player pool DataFrame
+        """
+        pool_index = get_player_pool_index(player_pool_df)
+        if pool_index is self._pool_index:
+            return
+        
+        self._pool_index = pool_index
+        self.team_totals = np.zeros((self.num_teams, pool_index.z_matrix.shape[1]))
+        self.available_mask = np.ones(len(pool_index.player_rows), dtype=bool)
+        self._available_cursor = 0
+        self.user_position_counts = Counter()
+        self.elite_by_position = {
+            main_position: int((pool_index.elite_mask & bucket).sum())
+            for main_position, bucket in pool_index.position_buckets.items()
+        }
+        for team_id, roster_ids in self.team_rosters.items():
+            for player_id in roster_ids:
+                self._record_pick(player_id, team_id)
+    
+    def _record_pick(self, player_id: str, team_id: int):
+        """Update the pool caches for a drafted player."""
+        row = self._pool_index.player_rows.get(player_id)
+        if row is not None:
+            self.team_totals[team_id - 1] += self._pool_index.z_matrix[row]
+            if self.available_mask[row]:
+                for main_position in self._pool_index.elite_row_positions.get(row, ()):
+                    self.elite_by_position[main_position] -= 1
+            self.available_mask[row] = False
+            position = self._pool_index.positions[row]
+            if team_id == self.user_team_id and pd.notna(position):
+                self.user_position_counts.update(position.split('-'))
+    
+    def next_available_row(self) -> Optional[int]:
+        """
+        Get the first undrafted row of the bound player pool.
+        
+        The pool is served best-first, so this is the best available player.
+        Drafted rows never come back, so the scan resumes where the last one
+        stopped and a whole draft walks the pool at most once.
+        
+        Returns:
+            Pool row position, or None if every player has been drafted
+        """
+        num_rows = len(self.available_mask)
+        while self._available_cursor < num_rows and not self.available_mask[self._available_cursor]:
+            self._available_cursor += 1
+        return self._available_cursor if self._available_cursor < num_rows else None
+    
+    @property
+    def draft_order(self) -> List[int]:
+        """Team order for the current round (serpentine: even rounds run in reverse)."""
+        order = list(range(1, self.num_teams + 1))
+        return order if self.round % 2 == 1 else order[::-1]
     
     def advance_pick(self):
         """Advance to the next pick using serpentine logic."""
-        idx = self.draft_order.index(self.current_pick_team)
-        if idx + 1 < len(self.draft_order):
-            self.current_pick_team = self.draft_order[idx + 1]
+        next_team = self.current_pick_team + (1 if self.round % 2 == 1 else -1)
+        if 1 <= next_team <= self.num_teams:
+            self.current_pick_team = next_team
         else:
-            # End of round: increment round, reverse order
+            # End of round: the same team opens the next round in reverse order
             self.round += 1
-            self.draft_order = self.draft_order[::-1]
-            self.current_pick_team = self.draft_order[0]
     
     def is_complete(self) -> bool:
         """Check if draft is complete."""
@@ -867,6 +1109,8 @@ class DraftState:
         """Draft a player to a team."""
         self.team_rosters[team_id].append(player_id)
         self.drafted_players.append(player_id)
+        if self.team_totals is not None:
+            self._record_pick(player_id, team_id)
         if player_name:
             self.status_message = f"Team {team_id} drafted {player_name}!"
     
@@ -880,7 +1124,8 @@ class PickSuggestionEngine:
     
     def __init__(self, player_pool_df: pd.DataFrame):
         self.player_pool_df = player_pool_df
-        self.category_analyzer = CategoryAnalyzer(player_pool_df)
+        self.category_analyzer = get_category_analyzer(player_pool_df)
+        self._pool_index = self.category_analyzer._pool_index
     
     def get_suggestions(
         self, 
@@ -891,7 +1136,10 @@ class PickSuggestionEngine:
         num_teams: int,
         max_suggestions: int = 5,
         all_team_rosters: Dict[int, List[str]] = None,
-        user_team_id: int = None
+        user_team_id: int = None,
+        team_totals: Optional[np.ndarray] = None,
+        user_position_counts: Optional[Dict[str, int]] = None,
+        elite_by_position: Optional[Dict[str, int]] = None
     ) -> List[Dict[str, Any]]:
         """
         Generate pick suggestions with reasoning.
@@ -905,294 +1153,235 @@ class PickSuggestionEngine:
             max_suggestions: Maximum number of suggestions to return
             all_team_rosters: Dictionary of all team rosters for relative analysis
             user_team_id: User's team ID for relative analysis
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
+            user_position_counts: Optional roster position counts (see DraftState.user_position_counts)
+            elite_by_position: Optional elite players left per position (see DraftState.elite_by_position)
             
         Returns:
             List of suggestion dictionaries
         """
-        suggestions = []
-        
         if len(available_players) == 0:
-            return suggestions
-        
-        # Get user's current roster for analysis
-        user_roster_df = self.player_pool_df[
-            self.player_pool_df["player_id"].isin(user_roster_ids)
-        ] if user_roster_ids else pd.DataFrame()
+            return []
         
         # Get category needs (now with relative rankings if available)
         weak_categories = self.category_analyzer.get_priority_needs(
-            user_roster_ids, all_team_rosters, user_team_id
+            user_roster_ids, all_team_rosters, user_team_id, team_totals
         )
         
         # Detect punt strategies if we have enough players
         punt_analysis = self.category_analyzer.detect_punt_strategies(
-            user_roster_ids, all_team_rosters, user_team_id
+            user_roster_ids, all_team_rosters, user_team_id, team_totals=team_totals
         )
         punt_categories = [p['category'] for p in punt_analysis.get('punt_categories', [])]
         punt_confidence = punt_analysis.get('strategy_confidence', 'none')
         
-        # Analyze top 10 available players
+        # Analyze top 10 available players, scoring every rule column-wise
         top_players = available_players.head(10)
+        num_players = len(top_players)
+        z_scores = top_players['total_z_score'].to_numpy(dtype=float)
+        main_positions = [position.split('-')[0] for position in top_players['position']]
+        priority_scores = np.zeros(num_players, dtype=int)
+        has_reason = np.zeros(num_players, dtype=bool)
+        
+        # 1. Punt Strategy Analysis (NEW - High Priority)
+        punt_levels = np.zeros(num_players, dtype=int)
+        if punt_categories and punt_confidence in ['high', 'medium']:
+            # Strength in non-punt categories (turnovers flipped, negatives ignored)
+            non_punt_indices = [i for i, (cat, _, _, _) in enumerate(CATEGORY_FIELDS)
+                                if cat not in punt_categories and cat in top_players]
+            non_punt_categories = [CATEGORY_FIELDS[i][0] for i in non_punt_indices]
+            non_punt_values = top_players[non_punt_categories].to_numpy(dtype=float) * CATEGORY_SIGNS[non_punt_indices]
+            non_punt_strength = np.nansum(np.maximum(non_punt_values, 0), axis=1)
+            
+            # The fit bonus applies once per punt category the player has a value for
+            punt_value_counts = top_players.reindex(columns=punt_categories).notna().sum(axis=1).to_numpy()
+            punt_levels = _tier_levels(non_punt_strength, PUNT_FIT_TIERS)
+            punt_levels[punt_value_counts == 0] = 0
+            priority_scores += _tier_bonuses(punt_levels, PUNT_FIT_TIERS) * punt_value_counts
+            has_reason |= punt_levels > 0
+        
+        # 2. Position Scarcity Analysis
+        if elite_by_position is None:
+            # Elite players still on the board, as a mask over the pool
+            available_rows = self._pool_index.player_ids.get_indexer(available_players['player_id'])
+            elite_available = np.zeros(len(self._pool_index.player_ids), dtype=bool)
+            elite_available[available_rows[available_rows >= 0]] = True
+            elite_available &= self._pool_index.elite_mask
+            elite_by_position = {
+                main_position: int(elite_available[self._pool_index.position_buckets[main_position]].sum())
+                for main_position in set(main_positions)
+            }
+        elite_counts = np.array([elite_by_position[p] for p in main_positions], dtype=int)
+        scarcity_levels = np.select([elite_counts <= 3, elite_counts <= 5], [1, 2], 0)
+        priority_scores += np.array([0, 15, 10])[scarcity_levels]
+        has_reason |= scarcity_levels > 0
+        
+        # 3. Category Need Analysis (Enhanced with relative rankings and punt awareness)
+        need_categories = [cat for cat in weak_categories if cat not in punt_categories and cat in top_players]
+        need_hits = top_players[need_categories].to_numpy(dtype=float) > 1
+        priority_scores += 20 * need_hits.sum(axis=1)  # Higher priority for addressing relative weaknesses
+        has_reason |= need_hits.any(axis=1)
+        
+        # 4. Value vs ADP Analysis
+        current_pick_number = ((current_round - 1) * num_teams) + draft_position
+        adps = top_players['adp'].to_numpy(dtype=float)
+        adp_values = adps - current_pick_number
+        adp_levels = np.select([adp_values > 12, adp_values > 6, adp_values < -6], [1, 2, 3], 0)
+        priority_scores += np.array([0, 20, 10, -5])[adp_levels]
+        has_reason |= adp_levels > 0
+        
+        # 5. Team Need Assessment (Position)
+        position_need_levels = np.zeros(num_players, dtype=int)
+        user_roster_rows = self.category_analyzer._roster_rows(user_roster_ids)
+        if user_roster_rows.size > 0:
+            if user_position_counts is None:
+                user_position_counts = (self.player_pool_df['position'].iloc[user_roster_rows]
+                                        .str.split('-').explode().value_counts())
+            position_counts = np.array([user_position_counts.get(p, 0) for p in main_positions], dtype=int)
+            depth_positions = np.isin(main_positions, ['C', 'PG'])
+            position_need_levels = np.select([position_counts == 0, (position_counts == 1) & depth_positions], [1, 2], 0)
+            priority_scores += np.array([0, 12, 8])[position_need_levels]
+            has_reason |= position_need_levels > 0
+        
+        # 6. Z-Score Tier Analysis (Enhanced with Advanced Stats)
+        z_drops = z_scores - np.append(z_scores[1:], 0)
+        
+        # Advanced stats bonus evaluation
+        advanced_levels = []
+        for column, tiers in ADVANCED_STAT_TIERS:
+            if column in top_players:
+                levels = _tier_levels(top_players[column].to_numpy(dtype=float), tiers)
+                priority_scores += _tier_bonuses(levels, tiers)
+                has_reason |= np.array([False] + [reason is not None for _, _, _, reason in tiers])[levels]
+                advanced_levels.append((tiers, levels))
+        
+        # Traditional tier analysis
+        z_tier_levels = _tier_levels(z_scores, Z_SCORE_TIERS)
+        priority_scores += _tier_bonuses(z_tier_levels, Z_SCORE_TIERS)
+        has_reason |= z_tier_levels > 0
+        
+        tier_drops = z_drops > 2
+        priority_scores += 8 * tier_drops
+        has_reason |= tier_drops
+        
+        # 7. Round-specific logic
+        if current_round <= 3:
+            round_threshold, round_bonus, round_reason = 8, 10, "Top-tier talent for early rounds"
+        elif current_round <= 6:
+            round_threshold, round_bonus, round_reason = 5, 8, "Strong mid-round value"
+        else:
+            round_threshold, round_bonus, round_reason = 2, 5, "Good late-round upside"
+        round_hits = z_scores > round_threshold
+        priority_scores += round_bonus * round_hits
+        has_reason |= round_hits
+        
+        # 8. Next pick timing
+        picks_until_next = (num_teams * 2) - draft_position if current_round % 2 == 1 else draft_position - 1
+        if picks_until_next > 20:
+            priority_scores += 5
+            has_reason[:] = True
+        
+        # Sort by priority score (stable, so ties keep z-score order) and only
+        # build reasoning for the players that make the cut
+        candidates = np.flatnonzero(has_reason)
+        winners = candidates[np.argsort(-priority_scores[candidates], kind='stable')][:max_suggestions]
         
-        for idx, player in top_players.iterrows():
+        suggestions = []
+        for i in winners:
+            player = top_players.iloc[i]
+            position = player['position']
+            main_position = main_positions[i]
             reasoning_parts = []
-            priority_score = 0
             
-            # 1. Punt Strategy Analysis (NEW - High Priority)
-            if punt_categories and punt_confidence in ['high', 'medium']:
-                punt_bonus = 0
-                punt_insights = []
-                
-                # Check if player fits punt strategy
-                for punt_cat in punt_categories:
-                    if punt_cat in player and pd.notna(player[punt_cat]):
-                        punt_z_score = player[punt_cat]
-                        
-                        # For punt categories, we don't care if they're weak (or even prefer it)
-                        # For non-punt categories, we want them to be strong
-                        all_categories = list(self.category_analyzer.CATEGORIES.keys())
-                        non_punt_categories = [cat for cat in all_categories if cat not in punt_categories]
-                        
-                        # Calculate punt-friendly score
-                        non_punt_strength = 0
-                        for non_punt_cat in non_punt_categories:
-                            if non_punt_cat in player and pd.notna(player[non_punt_cat]):
-                                cat_z = player[non_punt_cat]
-                                # Adjust for turnovers (negative is good)
-                                if non_punt_cat == 'z_turnovers':
-                                    cat_z = -cat_z
-                                non_punt_strength += max(0, cat_z)
-                        
-                        # Bonus for being strong in non-punt categories
-                        if non_punt_strength > 5:  # Strong in multiple non-punt categories
-                            punt_bonus += 15
-                            punt_insights.append("Excellent punt strategy fit")
-                        elif non_punt_strength > 3:
-                            punt_bonus += 10
-                            punt_insights.append("Good punt strategy fit")
-                        elif non_punt_strength > 1:
-                            punt_bonus += 5
-                            punt_insights.append("Decent punt strategy fit")
+            if punt_levels[i]:
+                reasoning_parts.append(PUNT_FIT_TIERS[punt_levels[i] - 1][3])
                 
-                # Add punt strategy reasoning
-                if punt_insights:
-                    reasoning_parts.extend(punt_insights[:1])  # Add top punt insight
-                    priority_score += punt_bonus
-                    
-                    # Add specific punt strategy context
-                    if punt_confidence == 'high':
-                        punt_cat_names = [self.category_analyzer.CATEGORIES[cat]['short'] for cat in punt_categories[:2]]
-                        reasoning_parts.append(f"Fits {'/'.join(punt_cat_names)} punt strategy")
-            
-            # 2. Position Scarcity Analysis
-            position = player['position']
-            position_available = available_players[
-                available_players['position'].str.contains(position.split('-')[0], na=False)
-            ]
-            elite_position_count = len(position_available[position_available['total_z_score'] > 5])
-            
-            if elite_position_count <= 3:
-                reasoning_parts.append(f"Only {elite_position_count} elite {position}s left")
-                priority_score += 15
-            elif elite_position_count <= 5:
+                # Add specific punt strategy context
+                if punt_confidence == 'high':
+                    punt_cat_names = [self.category_analyzer.CATEGORIES[cat]['short'] for cat in punt_categories[:2]]
+                    reasoning_parts.append(f"Fits {'/'.join(punt_cat_names)} punt strategy")
+            
+            if scarcity_levels[i] == 1:
+                reasoning_parts.append(f"Only {elite_counts[i]} elite {position}s left")
+            elif scarcity_levels[i] == 2:
                 reasoning_parts.append(f"Limited elite {position} options remaining")
-                priority_score += 10
-            
-            # 3. Category Need Analysis (Enhanced with relative rankings and punt awareness)
-            if weak_categories:
-                player_strengths = []
-                for weak_cat in weak_categories:
-                    # Skip weak categories that we're punting
-                    if weak_cat in punt_categories:
-                        continue
-                        
-                    if weak_cat in player and pd.notna(player[weak_cat]) and player[weak_cat] > 1:
-                        cat_info = self.category_analyzer.CATEGORIES[weak_cat]
-                        player_strengths.append(cat_info['short'])
-                        priority_score += 20  # Higher priority for addressing relative weaknesses
-                
-                if player_strengths:
-                    reasoning_parts.append(f"Addresses team weaknesses: {', '.join(player_strengths)}")
-            
-            # 4. Value vs ADP Analysis
-            if pd.notna(player['adp']):
-                current_pick_number = ((current_round - 1) * num_teams) + draft_position
-                adp_value = player['adp'] - current_pick_number
-                
-                if adp_value > 12:
-                    reasoning_parts.append(f"Excellent value - typically drafted {int(adp_value)} picks later")
-                    priority_score += 20
-                elif adp_value > 6:
-                    reasoning_parts.append(f"Good value - ADP suggests pick {int(player['adp'])}")
-                    priority_score += 10
-                elif adp_value < -6:
-                    reasoning_parts.append(f"Reaching early - ADP is pick {int(player['adp'])}")
-                    priority_score -= 5
             
-            # 5. Team Need Assessment (Position)
-            if len(user_roster_df) > 0:
-                team_positions = user_roster_df['position'].str.split('-').explode().value_counts()
-                main_position = position.split('-')[0]
-                position_count = team_positions.get(main_position, 0)
-                
-                if position_count == 0:
-                    reasoning_parts.append(f"Fills {main_position} need")
-                    priority_score += 12
-                elif position_count == 1 and main_position in ['C', 'PG']:
-                    reasoning_parts.append(f"Adds {main_position} depth")
-                    priority_score += 8
-            
-            # 6. Z-Score Tier Analysis (Enhanced with Advanced Stats)
-            z_score = player['total_z_score']
-            next_player_z = top_players.iloc[min(idx + 1, len(top_players) - 1)]['total_z_score'] if idx < len(top_players) - 1 else 0
-            z_drop = z_score - next_player_z
-            
-            # Advanced stats bonus evaluation
-            advanced_bonus = 0
-            advanced_insights = []
-            
-            # Usage rate evaluation
-            if 'usage_rate' in player and pd.notna(player['usage_rate']):
-                usage = player['usage_rate']
-                if usage > 0.28:  # High usage (28%+)
-                    advanced_bonus += 3
-                    advanced_insights.append("High usage player")
-                elif usage > 0.25:  # Above average usage
-                    advanced_bonus += 1
-                    advanced_insights.append("Above average usage")
-            
-            # Efficiency evaluation
-            if 'true_shooting_pct' in player and pd.notna(player['true_shooting_pct']):
-                ts_pct = player['true_shooting_pct']
-                if ts_pct > 0.60:  # Elite efficiency (60%+ TS)
-                    advanced_bonus += 4
-                    advanced_insights.append("Elite shooting efficiency")
-                elif ts_pct > 0.55:  # Good efficiency
-                    advanced_bonus += 2
-                    advanced_insights.append("Good shooting efficiency")
-                elif ts_pct < 0.50:  # Poor efficiency
-                    advanced_bonus -= 2
-                    advanced_insights.append("Below average efficiency")
-            
-            # PER evaluation
-            if 'player_efficiency_rating' in player and pd.notna(player['player_efficiency_rating']):
-                per = player['player_efficiency_rating']
-                if per > 25:  # Elite PER
-                    advanced_bonus += 3
-                    advanced_insights.append("Elite PER")
-                elif per > 20:  # Very good PER
-                    advanced_bonus += 2
-                    advanced_insights.append("Strong PER")
-                elif per > 15:  # Above average PER
-                    advanced_bonus += 1
-            
-            # Age factor for upside/decline risk
-            if 'age' in player and pd.notna(player['age']):
-                age = player['age']
-                if age <= 25:
-                    advanced_bonus += 2
-                    advanced_insights.append("Young with upside")
-                elif age <= 27:
-                    advanced_bonus += 1
-                    advanced_insights.append("Prime age")
-                elif age >= 32:
-                    advanced_bonus -= 1
-                    advanced_insights.append("Veteran (age risk)")
-            
-            # Games played consistency
-            if 'games_played' in player and pd.notna(player['games_played']):
-                gp = player['games_played']
-                if gp >= 70:
-                    advanced_bonus += 1
-                    advanced_insights.append("Durable (70+ games)")
-                elif gp < 50:
-                    advanced_bonus -= 2
-                    advanced_insights.append("Injury concerns")
-            
-            # Apply advanced bonus to priority score
-            priority_score += advanced_bonus
-            
-            # Add advanced insights to reasoning
-            if advanced_insights:
-                reasoning_parts.extend(advanced_insights[:2])  # Limit to top 2 insights
-            
-            # Traditional tier analysis
-            if z_score > 10:
-                reasoning_parts.append("Elite tier player")
-                priority_score += 15
-            elif z_score > 7:
-                reasoning_parts.append("High-tier option")
-                priority_score += 10
-            elif z_score > 4:
-                reasoning_parts.append("Solid contributor")
-                priority_score += 5
-            
-            if z_drop > 2:
+            player_strengths = [self.category_analyzer.CATEGORIES[cat]['short']
+                                for cat, hit in zip(need_categories, need_hits[i]) if hit]
+            if player_strengths:
+                reasoning_parts.append(f"Addresses team weaknesses: {', '.join(player_strengths)}")
+            
+            if adp_levels[i] == 1:
+                reasoning_parts.append(f"Excellent value - typically drafted {int(adp_values[i])} picks later")
+            elif adp_levels[i] == 2:
+                reasoning_parts.append(f"Good value - ADP suggests pick {int(adps[i])}")
+            elif adp_levels[i] == 3:
+                reasoning_parts.append(f"Reaching early - ADP is pick {int(adps[i])}")
+            
+            if position_need_levels[i] == 1:
+                reasoning_parts.append(f"Fills {main_position} need")
+            elif position_need_levels[i] == 2:
+                reasoning_parts.append(f"Adds {main_position} depth")
+            
+            advanced_insights = [tiers[levels[i] - 1][3] for tiers, levels in advanced_levels
+                                 if levels[i] and tiers[levels[i] - 1][3] is not None]
+            reasoning_parts.extend(advanced_insights[:2])  # Limit to top 2 insights
+            
+            if z_tier_levels[i]:
+                reasoning_parts.append(Z_SCORE_TIERS[z_tier_levels[i] - 1][3])
+            if tier_drops[i]:
                 reasoning_parts.append("Significant tier drop after this pick")
-                priority_score += 8
-            
-            # 7. Round-specific logic
-            if current_round <= 3:
-                if z_score > 8:
-                    reasoning_parts.append("Top-tier talent for early rounds")
-                    priority_score += 10
-            elif current_round <= 6:
-                if z_score > 5:
-                    reasoning_parts.append("Strong mid-round value")
-                    priority_score += 8
-            else:
-                if z_score > 2:
-                    reasoning_parts.append("Good late-round upside")
-                    priority_score += 5
-            
-            # 8. Next pick timing
-            picks_until_next = (num_teams * 2) - draft_position if current_round % 2 == 1 else draft_position - 1
+            if round_hits[i]:
+                reasoning_parts.append(round_reason)
             if picks_until_next > 20:
                 reasoning_parts.append(f"Long wait until next pick ({picks_until_next} picks)")
-                priority_score += 5
             
             # Create suggestion
-            if reasoning_parts:
-                main_reason = reasoning_parts[0]
-                additional_reasons = reasoning_parts[1:3]  # Limit to avoid clutter
-                
-                suggestion = {
-                    'player_name': player['name'],
-                    'player_id': player['player_id'],
-                    'position': player['position'],
-                    'z_score': player['total_z_score'],
-                    'adp': player['adp'],
-                    'main_reason': main_reason,
-                    'additional_reasons': additional_reasons,
-                    'priority_score': priority_score,
-                    'reasoning_text': f"{main_reason}" + (f" • {' • '.join(additional_reasons)}" if additional_reasons else "")
-                }
-                suggestions.append(suggestion)
-        
-        # Sort by priority score and return top suggestions
-        suggestions.sort(key=lambda x: x['priority_score'], reverse=True)
-        return suggestions[:max_suggestions]
+            main_reason = reasoning_parts[0]
+            additional_reasons = reasoning_parts[1:3]  # Limit to avoid clutter
+            
+            suggestions.append({
+                'player_name': player['name'],
+                'player_id': player['player_id'],
+                'position': position,
+                'z_score': player['total_z_score'],
+                'adp': player['adp'],
+                'main_reason': main_reason,
+                'additional_reasons': additional_reasons,
+                'priority_score': int(priority_scores[i]),
+                'reasoning_text': f"{main_reason}" + (f" • {' • '.join(additional_reasons)}" if additional_reasons else "")
+            })
+        
+        return suggestions
 
 
 class AIOpponent:
     """Handles AI opponent drafting logic."""
     
     @staticmethod
-    def make_pick(available_players: pd.DataFrame) -> Optional[Dict[str, Any]]:
+    def make_pick(player_pool_df: pd.DataFrame, draft_state: 'DraftState') -> Optional[Dict[str, Any]]:
         """
         Make an AI pick based on simple best available logic.
         
         Args:
-            available_players: DataFrame of available players
+            player_pool_df: Full player pool DataFrame (the pool bound to draft_state, if any)
+            draft_state: Current draft state
             
         Returns:
             Dictionary with picked player info or None if no players available
         """
-        if len(available_players) == 0:
-            return None
-        
         # Simple strategy: pick highest z-score player
-        best_player = available_players.iloc[0]
+        if draft_state.available_mask is not None:
+            best_row = draft_state.next_available_row()
+            if best_row is None:
+                return None
+            best_player = player_pool_df.iloc[best_row]
+        else:
+            available_players = get_available_players(player_pool_df, draft_state)
+            if len(available_players) == 0:
+                return None
+            best_player = available_players.iloc[0]
+        
         return {
             'player_id': best_player['player_id'],
             'player_name': best_player['name'],
@@ -1237,18 +1426,20 @@ def initialize_draft_state(num_teams: int, draft_position: int) -> DraftState:
     return st.session_state.draft_state
 
 
-def get_available_players(player_pool_df: pd.DataFrame, drafted_players: List[str]) -> pd.DataFrame:
+def get_available_players(player_pool_df: pd.DataFrame, draft_state: DraftState) -> pd.DataFrame:
     """
     Get players that haven't been drafted yet.
     
     Args:
-        player_pool_df: Full player pool DataFrame
-        drafted_players: List of drafted player IDs
+        player_pool_df: Full player pool DataFrame (the pool bound to draft_state, if any)
+        draft_state: Current draft state
         
     Returns:
         DataFrame of available players
     """
-    return player_pool_df[~player_pool_df["player_id"].isin(drafted_players)]
+    if draft_state.available_mask is not None:
+        return player_pool_df.iloc[np.flatnonzero(draft_state.available_mask)]
+    return player_pool_df[~player_pool_df["player_id"].isin(draft_state.drafted_players)]
 
 
 class DraftAnalytics:
@@ -1256,7 +1447,7 @@ class DraftAnalytics:
     
     def __init__(self, player_pool_df: pd.DataFrame):
         self.player_pool_df = player_pool_df
-        self.category_analyzer = CategoryAnalyzer(player_pool_df)
+        self.category_analyzer = get_category_analyzer(player_pool_df)
     
     def generate_draft_recap(self, draft_state: 'DraftState', config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1282,7 +1473,8 @@ class DraftAnalytics:
         for team_id, roster_ids in draft_state.team_rosters.items():
             if roster_ids:  # Only analyze teams with players
                 team_analysis = self._analyze_team_comprehensive(
-                    team_id, roster_ids, draft_state.team_rosters, draft_state.user_team_id
+                    team_id, roster_ids, draft_state.team_rosters, draft_state.user_team_id,
+                    draft_state.team_totals
                 )
                 team_analyses[team_id] = team_analysis
         
@@ -1307,7 +1499,8 @@ class DraftAnalytics:
     
     def _analyze_team_comprehensive(self, team_id: int, roster_ids: List[str], 
                                    all_team_rosters: Dict[int, List[str]], 
-                                   user_team_id: int) -> Dict[str, Any]:
+                                   user_team_id: int,
+                                   team_totals: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Comprehensive analysis of a single team.
         
@@ -1316,12 +1509,13 @@ class DraftAnalytics:
             roster_ids: List of player IDs on the team
             all_team_rosters: All team rosters for relative analysis
             user_team_id: User's team ID
+            team_totals: Optional per-team category totals (see DraftState.team_totals)
             
         Returns:
             Dictionary with comprehensive team analysis
         """
         # Get team roster data
-        roster_df = self.player_pool_df[self.player_pool_df["player_id"].isin(roster_ids)]
+        roster_df = self.category_analyzer.get_roster_players(roster_ids)
         
         if roster_df.empty:
             return self._get_empty_team_analysis(team_id)
@@ -1339,7 +1533,7 @@ class DraftAnalytics:
         
         # Category analysis with rankings
         category_analysis = self.category_analyzer.analyze_team_categories(
-            roster_ids, all_team_rosters, user_team_id
+            roster_ids, all_team_rosters, user_team_id, team_totals
         )
         
         # Position analysis
@@ -1347,7 +1541,7 @@ class DraftAnalytics:
         
         # Punt strategy detection
         punt_analysis = self.category_analyzer.detect_punt_strategies(
-            roster_ids, all_team_rosters, user_team_id
+            roster_ids, all_team_rosters, user_team_id, team_totals=team_totals
         )
         
         # Roster construction warnings
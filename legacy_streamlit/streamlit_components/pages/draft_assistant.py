@@ -638,7 +638,7 @@ if draft_type == "Mock Draft":
             # Analyze top 10 available players
             top_players = available_players.head(10)
             
-            for idx, player in top_players.iterrows():
+            for idx, player in enumerate(top_players.to_dict('records')):
                 reasoning_parts = []
                 priority_score = 0
                 
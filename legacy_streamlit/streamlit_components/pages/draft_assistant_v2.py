@@ -11,7 +11,6 @@ from legacy_streamlit.streamlit_components.utils.styling import apply_main_styli
 from legacy_streamlit.streamlit_components.utils.database import (
     get_player_pool, 
     get_detailed_player_stats, 
-    get_player_by_ids,
     get_available_seasons,
     get_database_engine
 )
@@ -38,10 +37,10 @@ from legacy_streamlit.streamlit_components.components.draft_logic import (
     DraftState,
     PickSuggestionEngine,
     AIOpponent,
-    CategoryAnalyzer,
     DraftAnalytics,
     initialize_draft_state,
-    get_available_players
+    get_available_players,
+    get_category_analyzer
 )
 
 
@@ -127,6 +126,7 @@ def handle_mock_draft(config: dict):
         
         # Initialize draft state
         draft_state = initialize_draft_state(config['num_teams'], config['draft_position'])
+        draft_state.bind_player_pool(player_pool_df)
         
         # Initialize suggestion engine
         suggestion_engine = PickSuggestionEngine(player_pool_df)
@@ -137,7 +137,7 @@ def handle_mock_draft(config: dict):
             return
         
         # Get available players
-        available_players = get_available_players(player_pool_df, draft_state.drafted_players)
+        available_players = get_available_players(player_pool_df, draft_state)
         
         if len(available_players) == 0:
             st.session_state.draft_complete = True
@@ -147,7 +147,7 @@ def handle_mock_draft(config: dict):
         if draft_state.current_pick_team == draft_state.user_team_id:
             handle_user_pick(draft_state, available_players, suggestion_engine, config)
         else:
-            handle_ai_pick(draft_state, available_players)
+            handle_ai_pick(draft_state, player_pool_df)
         
         # Display draft interface
         render_draft_interface(
@@ -174,7 +174,10 @@ def handle_user_pick(draft_state: DraftState, available_players: pd.DataFrame,
         config['num_teams'],
         max_suggestions=5,
         all_team_rosters=draft_state.team_rosters,
-        user_team_id=draft_state.user_team_id
+        user_team_id=draft_state.user_team_id,
+        team_totals=draft_state.team_totals,
+        user_position_counts=draft_state.user_position_counts,
+        elite_by_position=draft_state.elite_by_position
     )
     
     # Display suggestions
@@ -201,10 +204,10 @@ def handle_user_pick(draft_state: DraftState, available_players: pd.DataFrame,
         st.rerun()
 
 
-def handle_ai_pick(draft_state: DraftState, available_players: pd.DataFrame):
+def handle_ai_pick(draft_state: DraftState, player_pool_df: pd.DataFrame):
     """Handle AI opponent's pick."""
     
-    ai_pick = AIOpponent.make_pick(available_players)
+    ai_pick = AIOpponent.make_pick(player_pool_df, draft_state)
     
     if ai_pick:
         draft_state.draft_player(
@@ -236,21 +239,23 @@ def render_draft_interface(draft_state: DraftState, available_players: pd.DataFr
         st.info(draft_state.status_message)
     
     # Initialize category analyzer
-    category_analyzer = CategoryAnalyzer(player_pool_df)
+    category_analyzer = get_category_analyzer(player_pool_df)
     
     # Show user roster with category analysis (now with relative rankings)
-    user_roster_df = get_player_by_ids(draft_state.get_user_roster_ids(), player_pool_df)
+    user_roster_df = category_analyzer.get_roster_players(draft_state.get_user_roster_ids())
     user_category_analysis = category_analyzer.analyze_team_categories(
         draft_state.get_user_roster_ids(), 
         draft_state.team_rosters, 
-        draft_state.user_team_id
+        draft_state.user_team_id,
+        draft_state.team_totals
     )
     
     # Get punt strategy analysis
     punt_analysis = category_analyzer.detect_punt_strategies(
         draft_state.get_user_roster_ids(),
         draft_state.team_rosters,
-        draft_state.user_team_id
+        draft_state.user_team_id,
+        team_totals=draft_state.team_totals
     )
     
     # Get roster construction warnings
@@ -279,7 +284,7 @@ def render_draft_interface(draft_state: DraftState, available_players: pd.DataFr
             for team_id, roster_ids in draft_state.team_rosters.items():
                 st.markdown(f"**Team {team_id}{' (You)' if team_id == draft_state.user_team_id else ''}:**")
                 if roster_ids:
-                    team_df = get_player_by_ids(roster_ids, player_pool_df)
+                    team_df = category_analyzer.get_roster_players(roster_ids)
                     st.dataframe(
                         team_df[["name", "position", "total_z_score"]].rename(columns={
                             'name': 'Player',
@@ -302,7 +307,10 @@ def render_draft_interface(draft_state: DraftState, available_players: pd.DataFr
             config['num_teams'],
             max_suggestions=5,
             all_team_rosters=draft_state.team_rosters,
-            user_team_id=draft_state.user_team_id
+            user_team_id=draft_state.user_team_id,
+            team_totals=draft_state.team_totals,
+            user_position_counts=draft_state.user_position_counts,
+            elite_by_position=draft_state.elite_by_position
         ) if draft_state.get_user_roster_ids() else []
         
         render_draft_status(
@@ -317,7 +325,8 @@ def render_draft_interface(draft_state: DraftState, available_players: pd.DataFr
             weak_categories = category_analyzer.get_priority_needs(
                 draft_state.get_user_roster_ids(), 
                 draft_state.team_rosters, 
-                draft_state.user_team_id
+                draft_state.user_team_id,
+                draft_state.team_totals
             )
             
             # Filter out punt categories from priority needs
@@ -409,7 +418,7 @@ def handle_draft_complete(draft_state: DraftState, player_pool_df: pd.DataFrame,
             with tab:
                 roster_ids = draft_state.team_rosters[i]
                 if roster_ids:
-                    team_df = get_player_by_ids(roster_ids, player_pool_df)
+                    team_df = analytics_engine.category_analyzer.get_roster_players(roster_ids)
                     
                     # Enhanced roster display with more stats
                     display_columns = ["name", "team", "position", "total_z_score"]
@@ -254,7 +254,6 @@ def restore_draft_state_to_session(save_state: DraftSaveState):
         draft_state.drafted_players = save_state.drafted_players.copy()
         draft_state.team_rosters = {k: v.copy() for k, v in save_state.team_rosters.items()}
         draft_state.user_team_id = save_state.user_team_id
-        draft_state.draft_order = save_state.draft_order.copy()
         draft_state.complete = save_state.complete
         draft_state.status_message = save_state.status_message
         